@@ -0,0 +1,157 @@
+"""
+Copyright 2022 Google LLC
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_follow_changes]
+
+from __future__ import print_function
+
+import collections
+import concurrent.futures
+import json
+import os
+import time
+
+import google.auth
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+PAGE_SIZE = 1000
+POLL_INTERVAL = 60
+FILE_FIELDS = 'id, name, mimeType, parents, modifiedTime, trashed, md5Checksum'
+CHANGE_FIELDS = (F'nextPageToken, newStartPageToken, changes(changeType, '
+                 F'time, removed, fileId, file({FILE_FIELDS}))')
+
+Change = collections.namedtuple(
+    'Change', ['file_id', 'change_type', 'removed', 'time', 'file'])
+
+
+def load_checkpoint(checkpoint_path):
+    """Returns the saved page token, or None if there is no checkpoint."""
+    try:
+        with open(checkpoint_path, encoding='utf-8') as checkpoint:
+            return json.load(checkpoint).get('pageToken')
+    except (OSError, ValueError):
+        return None
+
+
+def save_checkpoint(checkpoint_path, page_token):
+    """Atomically replaces the checkpoint with page_token."""
+    tmp_path = checkpoint_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as checkpoint:
+        json.dump({'pageToken': page_token}, checkpoint)
+        checkpoint.flush()
+        os.fsync(checkpoint.fileno())
+    os.replace(tmp_path, checkpoint_path)
+
+
+def _pages(service, checkpoint_path, fields, poll_interval):
+    """Yields (changes, token to checkpoint, whether the feed caught up)."""
+    page_token = load_checkpoint(checkpoint_path)
+    if page_token is None:
+        # pylint: disable=maybe-no-member
+        page_token = service.changes().getStartPageToken().execute().get(
+            'startPageToken')
+        save_checkpoint(checkpoint_path, page_token)
+    while True:
+        # pylint: disable=maybe-no-member
+        response = service.changes().list(pageToken=page_token,
+                                          pageSize=PAGE_SIZE,
+                                          spaces='drive',
+                                          fields=fields).execute()
+        changes = [Change(file_id=change.get('fileId'),
+                          change_type=change.get('changeType'),
+                          removed=change.get('removed', False),
+                          time=change.get('time'),
+                          file=change.get('file'))
+                   for change in response.get('changes', [])]
+        if 'newStartPageToken' in response:
+            page_token = response.get('newStartPageToken')
+            yield changes, page_token, True
+            if poll_interval is None:
+                return
+            time.sleep(poll_interval)
+        else:
+            page_token = response.get('nextPageToken')
+            yield changes, page_token, False
+
+
+def iter_changes(checkpoint_path, fields=CHANGE_FIELDS, poll_interval=None):
+    """Yields Change records after the checkpointed page token.
+    Args:
+        checkpoint_path: JSON file holding the page token to resume from
+        fields: Partial response mask for changes().list
+        poll_interval: Seconds to wait between polls, or None to stop once
+            the feed is caught up
+    Yields : Change records. The checkpoint advances past a page only once
+        every record of that page has been consumed.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    creds, _ = google.auth.default()
+    # create drive api client
+    service = build('drive', 'v3', credentials=creds)
+    for changes, page_token, _ in _pages(service, checkpoint_path, fields,
+                                         poll_interval):
+        for change in changes:
+            yield change
+        save_checkpoint(checkpoint_path, page_token)
+
+
+def follow_changes(checkpoint_path, handler, max_workers=8,
+                   fields=CHANGE_FIELDS, poll_interval=POLL_INTERVAL,
+                   max_polls=None):
+    """Fans the change feed out to a worker pool, checkpointing each page.
+    Args:
+        checkpoint_path: JSON file holding the page token to resume from
+        handler: Callable invoked with each Change on a worker thread
+        max_workers: Number of changes handled concurrently
+        fields: Partial response mask for changes().list
+        poll_interval: Seconds to wait between polls
+        max_polls: Stop after this many polls, or run forever when None
+    Returns : Last checkpointed page token.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    creds, _ = google.auth.default()
+    page_token = None
+    polls = 0
+    try:
+        # create drive api client
+        service = build('drive', 'v3', credentials=creds)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            for changes, page_token, caught_up in _pages(
+                    service, checkpoint_path, fields, poll_interval):
+                # Consume the results so handler errors surface here.
+                list(executor.map(handler, changes))
+                save_checkpoint(checkpoint_path, page_token)
+                print(F'Processed {len(changes)} changes, '
+                      F'checkpoint: {page_token}')
+                polls += caught_up
+                if max_polls is not None and polls >= max_polls:
+                    break
+
+    except HttpError as error:
+        print(F'An error occurred: {error}')
+        page_token = None
+
+    return page_token
+
+
+if __name__ == '__main__':
+    follow_changes(checkpoint_path='changes_checkpoint.json',
+                   handler=lambda change: print(
+                       F'Change found for file: {change.file_id}'))
+# [END drive_follow_changes]
@@ -0,0 +1,49 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+
+import follow_changes
+
+
+class TestFollowChanges(unittest.TestCase):
+    """Unit test classs for Change snippet"""
+
+    def test_follow_changes(self):
+        """Test follow_changes checkpoints the new start page token"""
+        with tempfile.TemporaryDirectory() as state_dir:
+            checkpoint_path = os.path.join(state_dir, 'checkpoint.json')
+            changes = []
+            token = follow_changes.follow_changes(
+                checkpoint_path=checkpoint_path, handler=changes.append,
+                poll_interval=0, max_polls=1)
+            self.assertIsNotNone(token)
+            self.assertEqual(token,
+                             follow_changes.load_checkpoint(checkpoint_path))
+
+    def test_iter_changes(self):
+        """Test iter_changes stops once the feed is caught up"""
+        with tempfile.TemporaryDirectory() as state_dir:
+            checkpoint_path = os.path.join(state_dir, 'checkpoint.json')
+            for change in follow_changes.iter_changes(checkpoint_path):
+                self.assertIsNotNone(change.file_id)
+            self.assertIsNotNone(
+                follow_changes.load_checkpoint(checkpoint_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
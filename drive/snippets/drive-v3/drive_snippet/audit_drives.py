@@ -0,0 +1,166 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_audit_drives]
+
+from __future__ import print_function
+
+import concurrent.futures
+import json
+import random
+import threading
+import time
+
+import google.auth
+import httplib2
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+# Drive accepts at most 100 calls in one batch request.
+BATCH_SIZE = 100
+MAX_WORKERS = 4
+MAX_RETRIES = 5
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _is_retryable(error):
+    # Connection resets and timeouts are as transient as a 503.
+    if not isinstance(error, HttpError):
+        return True
+    if error.resp.status == 403:
+        return b'ratelimitexceeded' in (error.content or b'').lower()
+    return error.resp.status in RETRYABLE_STATUSES
+
+
+def _add_organizers(creds, local, drives, permission):
+    """Creates the organizer permission on a batch of drives, retrying
+    only the calls that failed with a rate limit, transient or connection
+    error. Never raises; errors are recorded per drive."""
+    if not hasattr(local, 'service'):
+        # httplib2 is not thread-safe, each worker gets its own client.
+        local.service = build('drive', 'v3', credentials=creds)
+    service = local.service
+    results = {}
+    pending = drives
+    for attempt in range(MAX_RETRIES + 1):
+        retry = []
+
+        # pylint: disable=cell-var-from-loop
+        def callback(request_id, response, exception):
+            drive = pending[int(request_id)]
+            if exception is None:
+                results[drive['id']] = {'permissionId': response.get('id')}
+            elif _is_retryable(exception) and attempt < MAX_RETRIES:
+                retry.append(drive)
+            else:
+                results[drive['id']] = {'error': str(exception)}
+
+        # pylint: disable=maybe-no-member
+        batch = service.new_batch_http_request(callback=callback)
+        for index, drive in enumerate(pending):
+            batch.add(service.permissions().create(
+                fileId=drive['id'], body=permission,
+                useDomainAdminAccess=True, supportsAllDrives=True,
+                fields='id'), request_id=str(index))
+        try:
+            batch.execute()
+        except (HttpError, OSError, httplib2.HttpLib2Error) as error:
+            if not _is_retryable(error) or attempt == MAX_RETRIES:
+                for drive in pending:
+                    results.setdefault(drive['id'], {'error': str(error)})
+                return results
+            retry = [drive for drive in pending if drive['id'] not in results]
+        if not retry:
+            break
+        time.sleep(min(2 ** attempt, 64) + random.random())
+        pending = retry
+    return results
+
+
+def audit_drives(real_user, report_path=None):
+    """Find all shared drives without an organizer, then add one in batches.
+    Args:
+        real_user: User ID for the new organizer.
+        report_path: Optional path the JSON report is written to.
+    Returns:
+        Report listing each drive found and the outcome of its repair.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    creds, _ = google.auth.default()
+    report = None
+    try:
+        # create drive api client
+        service = build('drive', 'v3', credentials=creds)
+
+        # Phase 1: collect every drive lacking an organizer.
+        drives = []
+        page_token = None
+        while True:
+            # pylint: disable=maybe-no-member
+            response = service.drives().list(
+                q='organizerCount = 0', pageSize=100,
+                fields='nextPageToken, drives(id, name)',
+                useDomainAdminAccess=True, pageToken=page_token).execute()
+            drives.extend(response.get('drives', []))
+            page_token = response.get('nextPageToken', None)
+            if page_token is None:
+                break
+        print(F'Found {len(drives)} shared drives without organizer.')
+
+        # Phase 2: add the organizer through concurrent batch requests.
+        new_organizer_permission = {
+            'type': 'user',
+            'role': 'organizer',
+            'emailAddress': real_user
+        }
+        local = threading.local()
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(_add_organizers, creds, local,
+                                drives[start:start + BATCH_SIZE],
+                                new_organizer_permission)
+                for start in range(0, len(drives), BATCH_SIZE)]
+            for future in futures:
+                results.update(future.result())
+
+        report = {
+            'organizer': real_user,
+            'drives': [dict(drive, **results[drive['id']])
+                       for drive in drives],
+            'repaired': sum(1 for result in results.values()
+                            if 'permissionId' in result),
+            'failed': sum(1 for result in results.values()
+                          if 'error' in result),
+        }
+        print(F'Added organizer to {report["repaired"]} drives, '
+              F'{report["failed"]} failed.')
+        if report_path:
+            with open(report_path, 'w', encoding='utf-8') as report_file:
+                json.dump(report, report_file, indent=2)
+
+    except HttpError as error:
+        print(F'An error occurred: {error}')
+
+    return report
+
+
+if __name__ == '__main__':
+    audit_drives(real_user='gduser1@workspacesamples.dev',
+                 report_path='drive_audit.json')
+# [END drive_audit_drives]
@@ -0,0 +1,158 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_batch_executor]
+
+from __future__ import print_function
+
+import collections
+import concurrent.futures
+import itertools
+import random
+import threading
+import time
+
+import httplib2
+import service_cache
+from googleapiclient.errors import HttpError
+
+# Drive accepts at most 100 calls in one batch request.
+MAX_BATCH_SIZE = 100
+MAX_WORKERS = 4
+MAX_RETRIES = 5
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+Outcome = collections.namedtuple('Outcome', ['response', 'error'])
+
+
+def is_retryable(error):
+    """Returns whether an HttpError is a rate limit or transient error."""
+    status = error.resp.status
+    if status == 403:
+        return b'ratelimitexceeded' in (error.content or b'').lower()
+    return status in RETRYABLE_STATUSES
+
+
+class RateLimiter(object):
+    """Token bucket that spaces calls out to a steady rate per second."""
+
+    def __init__(self, rate):
+        self._rate = float(rate)
+        self._lock = threading.Lock()
+        self._next_time = time.monotonic()
+
+    def acquire(self, calls=1):
+        """Blocks until `calls` more calls fit within the rate."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + calls / self._rate
+        time.sleep(max(start - now, 0))
+
+
+def _backoff(attempt):
+    time.sleep(min(2 ** attempt, 64) + random.random())
+
+
+def _execute_batch(items, api, version, max_retries, limiter):
+    """Executes one batch, retrying only the calls that failed.
+    Never raises for a call; its last error is recorded in its Outcome."""
+    service = service_cache.get_service(api, version)
+    outcomes = {}
+    pending = items
+    for attempt in range(max_retries + 1):
+        failed = []
+
+        # pylint: disable=cell-var-from-loop
+        def callback(request_id, response, exception):
+            key, factory = pending[int(request_id)]
+            if exception is None:
+                outcomes[key] = Outcome(response, None)
+            elif isinstance(exception, HttpError) and \
+                    is_retryable(exception) and attempt < max_retries:
+                failed.append((key, factory))
+            else:
+                outcomes[key] = Outcome(None, exception)
+
+        # pylint: disable=maybe-no-member
+        batch = service.new_batch_http_request(callback=callback)
+        for index, (_, factory) in enumerate(pending):
+            batch.add(factory(service), request_id=str(index))
+        if limiter is not None:
+            limiter.acquire(len(pending))
+        try:
+            batch.execute()
+        except (HttpError, OSError, httplib2.HttpLib2Error) as error:
+            # Connection resets and timeouts fail the whole batch, but are
+            # as transient as a 503.
+            retryable = not isinstance(error, HttpError) or \
+                is_retryable(error)
+            if not retryable or attempt == max_retries:
+                for key, _ in pending:
+                    outcomes.setdefault(key, Outcome(None, error))
+                return outcomes
+            failed = [item for item in pending if item[0] not in outcomes]
+        if not failed:
+            break
+        _backoff(attempt)
+        pending = failed
+    return outcomes
+
+
+def execute_batched(requests, api='drive', version='v3',
+                    batch_size=MAX_BATCH_SIZE, max_workers=MAX_WORKERS,
+                    max_retries=MAX_RETRIES, rate_limit=None):
+    """Executes many calls as concurrent batch requests.
+    Args:
+        requests: Iterable of (key, factory) pairs. factory(service) returns
+            the HttpRequest for the key; it is called on the worker thread
+            that executes it, because clients are not shared across threads.
+        api: Name of the api the requests belong to
+        version: Version of the api
+        batch_size: Calls per batch request
+        max_workers: Number of batch requests in flight
+        max_retries: Retries, with exponential backoff and jitter, of calls
+            that failed with a rate limit, transient or connection error
+        rate_limit: Optional maximum number of calls sent per second
+    Returns : Dict mapping each key to an Outcome(response, error).
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    requests = iter(requests)
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+    outcomes = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = []
+        while True:
+            items = list(itertools.islice(requests, batch_size))
+            if not items:
+                break
+            futures.append(executor.submit(_execute_batch, items, api,
+                                           version, max_retries, limiter))
+        for future in concurrent.futures.as_completed(futures):
+            outcomes.update(future.result())
+    return outcomes
+
+
+if __name__ == '__main__':
+    results = execute_batched(
+        (file_id, lambda service, file_id=file_id: service.files().get(
+            fileId=file_id, fields='id, name'))
+        for file_id in ['1KuPmvGq8yoYgbfW74OENMCB5H0n_2Jm9'])
+    for file_id, outcome in results.items():
+        print(F'{file_id}: {outcome.response or outcome.error}')
+# [END drive_batch_executor]
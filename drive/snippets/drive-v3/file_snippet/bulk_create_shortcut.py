@@ -0,0 +1,111 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_bulk_create_shortcut]
+
+from __future__ import print_function
+
+import batch_executor
+import metadata_index
+from googleapiclient.errors import HttpError
+
+SHORTCUT_MIME_TYPE = 'application/vnd.google-apps.shortcut'
+
+
+def _get_name(file_id):
+    def factory(service):
+        # pylint: disable=maybe-no-member
+        return service.files().get(fileId=file_id, fields='id, name')
+    return factory
+
+
+def _create_shortcut(name, target_id, parent_id):
+    def factory(service):
+        file_metadata = {
+            'name': name,
+            'mimeType': SHORTCUT_MIME_TYPE,
+            'parents': [parent_id],
+            'shortcutDetails': {'targetId': target_id}
+        }
+        # pylint: disable=maybe-no-member
+        return service.files().create(
+            body=file_metadata,
+            fields='id, name, mimeType, parents, shortcutDetails(targetId)')
+    return factory
+
+
+def bulk_create_shortcut(links, index_path='drive_index.db'):
+    """Create shortcuts for many (target, parent) pairs, skipping duplicates.
+    Args:
+        links: Iterable of (target file ID, parent folder ID) pairs
+        index_path: SQLite metadata index consulted for existing shortcuts
+    Returns : Dict mapping each (target, parent) pair to its shortcut ID,
+        or None when the creation failed.
+
+    The index is synced from the changes feed first and receives the new
+    shortcuts, so re-running with the same links sends no create request.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    links = list(dict.fromkeys(links))
+    index = metadata_index.MetadataIndex(index_path)
+    try:
+        index.sync()
+        target_ids = {target_id for target_id, _ in links}
+        shortcuts = index.get_shortcuts(target_ids)
+        missing = [link for link in links if link not in shortcuts]
+        print(F'{len(links) - len(missing)} shortcuts already exist.')
+
+        names = {file_id: file['name']
+                 for file_id, file in index.get(target_ids).items()}
+        outcomes = batch_executor.execute_batched(
+            (target_id, _get_name(target_id))
+            for target_id in {target_id for target_id, _ in missing}
+            if target_id not in names)
+        for target_id, outcome in outcomes.items():
+            if outcome.error is None:
+                names[target_id] = outcome.response.get('name')
+
+        outcomes = batch_executor.execute_batched(
+            ((target_id, parent_id),
+             _create_shortcut(names.get(target_id), target_id, parent_id))
+            for target_id, parent_id in missing)
+        created = []
+        for link, outcome in outcomes.items():
+            if outcome.error is not None:
+                print(F'An error occurred: {outcome.error}')
+                shortcuts[link] = None
+            else:
+                shortcuts[link] = outcome.response.get('id')
+                created.append(outcome.response)
+        index.upsert(created)
+        print(F'Created {len(created)} shortcuts.')
+
+    except HttpError as error:
+        print(F'An error occurred: {error}')
+        return None
+
+    finally:
+        index.close()
+
+    return {link: shortcuts[link] for link in links}
+
+
+if __name__ == '__main__':
+    bulk_create_shortcut(links=[('1KuPmvGq8yoYgbfW74OENMCB5H0n_2Jm9',
+                                 '1jvTFoyBhUspwDncOTB25kb9k0Fl0EqeN')])
+# [END drive_bulk_create_shortcut]
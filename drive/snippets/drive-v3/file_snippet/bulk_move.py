@@ -0,0 +1,111 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_bulk_move]
+
+from __future__ import print_function
+
+import batch_executor
+from googleapiclient.errors import HttpError
+
+
+def _get_parents(file_id):
+    def factory(service):
+        # pylint: disable=maybe-no-member
+        return service.files().get(fileId=file_id, fields='id, parents')
+    return factory
+
+
+def _move(file_id, folder_id, previous_parents):
+    def factory(service):
+        # pylint: disable=maybe-no-member
+        return service.files().update(fileId=file_id, addParents=folder_id,
+                                      removeParents=previous_parents,
+                                      fields='id, parents')
+    return factory
+
+
+def bulk_move(moves, index=None, max_workers=4):
+    """Move many files to their destination folders with batch requests.
+    Args:
+        moves: Dict mapping file IDs to the ID of their destination folder
+        index: Optional metadata_index.MetadataIndex used to resolve the
+            current parents without any request, synced from the changes
+            feed first
+    Returns : Dict mapping each file ID to its new parent IDs, or None when
+        the move failed.
+
+    Parents missing from the index are fetched in one pass of batched gets,
+    then every file is moved in one pass of batched updates.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    parents = {}
+    if index is not None:
+        try:
+            # Stale parents would be left in place by removeParents.
+            index.sync()
+            for file_id, file in index.get(moves).items():
+                parents[file_id] = file['parents']
+        except HttpError as error:
+            print(F'An error occurred: {error}')
+    results = {}
+    missing = [file_id for file_id in moves if file_id not in parents]
+    if missing:
+        outcomes = batch_executor.execute_batched(
+            ((file_id, _get_parents(file_id)) for file_id in missing),
+            max_workers=max_workers)
+        for file_id, outcome in outcomes.items():
+            if outcome.error is not None:
+                print(F'An error occurred: {outcome.error}')
+                results[file_id] = None
+            else:
+                parents[file_id] = outcome.response.get('parents', [])
+
+    pending = []
+    for file_id, folder_id in moves.items():
+        if parents.get(file_id) == [folder_id]:
+            # Already in place, nothing to send.
+            results[file_id] = [folder_id]
+        elif file_id in parents:
+            pending.append(file_id)
+    outcomes = batch_executor.execute_batched(
+        ((file_id, _move(file_id, moves[file_id],
+                         ','.join(parents[file_id])))
+         for file_id in pending),
+        max_workers=max_workers)
+    for file_id, outcome in outcomes.items():
+        if outcome.error is not None:
+            print(F'An error occurred: {outcome.error}')
+            results[file_id] = None
+        else:
+            results[file_id] = outcome.response.get('parents')
+    if index is not None:
+        index.upsert(dict(file, parents=results[file_id])
+                     for file_id, file in index.get(moves).items()
+                     if results.get(file_id) is not None)
+    moved = sum(1 for value in results.values() if value is not None)
+    print(F'Moved {moved} of {len(moves)} files.')
+    return results
+
+
+if __name__ == '__main__':
+    bulk_move(moves={
+        '1KuPmvGq8yoYgbfW74OENMCB5H0n_2Jm9':
+            '1jvTFoyBhUspwDncOTB25kb9k0Fl0EqeN',
+    })
+# [END drive_bulk_move]
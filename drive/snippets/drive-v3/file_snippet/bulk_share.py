@@ -0,0 +1,74 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_bulk_share]
+
+from __future__ import print_function
+
+import batch_executor
+
+
+def bulk_share(real_shares, send_notification_email=False, max_workers=4):
+    """Share many files through concurrent batch requests.
+    Args:
+        real_shares: Iterable of (file ID, permission) pairs, where the
+            permission has the shape used by share_file
+        send_notification_email: Whether to email the new grantees
+        max_workers: Number of batch requests in flight
+    Returns : List of (file ID, permission, permission ID, error) tuples in
+        input order. Either the permission ID or the error is None.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    shares = list(real_shares)
+
+    def create_permission(file_id, permission):
+        def factory(service):
+            # pylint: disable=maybe-no-member
+            return service.permissions().create(
+                fileId=file_id, body=permission, fields='id',
+                sendNotificationEmail=send_notification_email)
+        return factory
+
+    outcomes = batch_executor.execute_batched(
+        ((index, create_permission(file_id, permission))
+         for index, (file_id, permission) in enumerate(shares)),
+        max_workers=max_workers)
+    results = []
+    for index, (file_id, permission) in enumerate(shares):
+        outcome = outcomes[index]
+        if outcome.error is not None:
+            print(F'An error occurred sharing {file_id}: {outcome.error}')
+            results.append((file_id, permission, None, outcome.error))
+        else:
+            results.append((file_id, permission,
+                            outcome.response.get('id'), None))
+    shared = sum(1 for result in results if result[3] is None)
+    print(F'Created {shared} of {len(results)} permissions.')
+    return results
+
+
+if __name__ == '__main__':
+    bulk_share(real_shares=[
+        ('1dUiRSoAQKkM3a4nTPeNQWgiuau1KdQ_l',
+         {'type': 'user', 'role': 'writer',
+          'emailAddress': 'gduser1@workspacesamples.dev'}),
+        ('1dUiRSoAQKkM3a4nTPeNQWgiuau1KdQ_l',
+         {'type': 'domain', 'role': 'reader',
+          'domain': 'workspacesamples.dev'}),
+    ])
+# [END drive_bulk_share]
@@ -0,0 +1,89 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_bulk_touch_file]
+
+from __future__ import print_function
+
+import batch_executor
+
+# Map fields whose updates are merged key by key instead of replaced.
+MERGED_FIELDS = ('appProperties', 'properties')
+
+
+def coalesce(updates):
+    """Merges a stream of (file ID, fields) updates into one body per file.
+
+    Later values win; appProperties and properties are merged per key.
+    """
+    bodies = {}
+    for file_id, fields in updates:
+        body = bodies.setdefault(file_id, {})
+        for name, value in fields.items():
+            if name in MERGED_FIELDS and isinstance(body.get(name), dict):
+                body[name] = dict(body[name], **value)
+            else:
+                body[name] = value
+    return bodies
+
+
+def _update(file_id, body, fields):
+    def factory(service):
+        # pylint: disable=maybe-no-member
+        return service.files().update(fileId=file_id, body=body,
+                                      fields=fields)
+    return factory
+
+
+def bulk_touch_file(real_updates, rate_limit=None, max_workers=4):
+    """Patch metadata such as modifiedTime of many files in batches.
+    Args:
+        real_updates: Iterable of (file ID, fields) pairs, e.g.
+            ('1KuPm...', {'modifiedTime': '2022-03-02T05:43:27.504Z'})
+        rate_limit: Optional maximum number of updates sent per second
+        max_workers: Number of batch requests in flight
+    Returns : Dict mapping each file ID to the updated file, or None when
+        the update failed.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    bodies = coalesce(real_updates)
+    outcomes = batch_executor.execute_batched(
+        ((file_id, _update(file_id, body,
+                           'id, ' + ', '.join(sorted(body))))
+         for file_id, body in bodies.items()),
+        max_workers=max_workers, rate_limit=rate_limit)
+    files = {}
+    for file_id, outcome in outcomes.items():
+        if outcome.error is not None:
+            print(F'An error occurred: {outcome.error}')
+            files[file_id] = None
+        else:
+            files[file_id] = outcome.response
+    touched = sum(1 for file in files.values() if file is not None)
+    print(F'Updated {touched} of {len(bodies)} files.')
+    return files
+
+
+if __name__ == '__main__':
+    bulk_touch_file(real_updates=[
+        ('17EqlSf7FpPU95SS00sICyVzQHpeET1cz',
+         {'modifiedTime': '2022-03-02T05:43:27.504Z'}),
+        ('17EqlSf7FpPU95SS00sICyVzQHpeET1cz',
+         {'appProperties': {'migrated': 'true'}}),
+    ], rate_limit=50)
+# [END drive_bulk_touch_file]
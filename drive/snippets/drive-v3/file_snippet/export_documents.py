@@ -0,0 +1,132 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_export_documents]
+
+from __future__ import print_function
+
+import concurrent.futures
+import mimetypes
+import os
+import re
+
+import json_state
+import page_iterator
+import service_cache
+import stream_download
+from googleapiclient.errors import HttpError
+
+DOCUMENT_MIME_TYPE = 'application/vnd.google-apps.document'
+EXTENSIONS = {
+    'application/pdf': '.pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
+        '.docx',
+    'application/vnd.oasis.opendocument.text': '.odt',
+    'text/plain': '.txt',
+}
+MAX_WORKERS = 8
+
+
+def _list_documents(service, query):
+    # pylint: disable=maybe-no-member
+    return list(page_iterator.iter_items(
+        service.files().list, 'files', fields='id, name, modifiedTime',
+        q=query, spaces='drive', pageSize=1000))
+
+
+def _output_paths(document, mime_types, out_dir):
+    name = re.sub(r'[^\w.-]+', '_', document['name']).strip('_') or 'document'
+    paths = {}
+    for mime_type in mime_types:
+        extension = (EXTENSIONS.get(mime_type) or
+                     mimetypes.guess_extension(mime_type) or '')
+        paths[mime_type] = os.path.join(
+            out_dir, F'{name}-{document["id"]}{extension}')
+    return paths
+
+
+def _export(document, paths):
+    for mime_type, path in paths.items():
+        tmp_path = path + '.part'
+        if stream_download.download_to(document['id'], tmp_path,
+                                       mime_type=mime_type) is None:
+            raise IOError(F'Export of {document["id"]} to {mime_type} failed')
+        os.replace(tmp_path, path)
+
+
+def export_documents(real_folder_id=None, query=None,
+                     mime_types=('application/pdf',), out_dir='exports',
+                     manifest_path=None, max_workers=MAX_WORKERS):
+    """Export many Google Docs to disk concurrently, skipping unchanged ones.
+    Args:
+        real_folder_id: Export the documents of this folder
+        query: Or export the documents matching this Drive query
+        mime_types: Target mimeTypes, each written to its own file
+        out_dir: Directory the exports are streamed to
+        manifest_path: JSON manifest of the modifiedTime last exported for
+            each document, defaults to out_dir/manifest.json
+        max_workers: Number of documents exported concurrently
+    Returns : List of the IDs of the documents exported in this run.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = manifest_path or os.path.join(out_dir, 'manifest.json')
+    manifest = json_state.load_json(manifest_path, {})
+    if query is None:
+        query = F"mimeType='{DOCUMENT_MIME_TYPE}' and trashed=false"
+        if real_folder_id:
+            query += F" and '{real_folder_id}' in parents"
+    exported = []
+    try:
+        service = service_cache.get_service('drive', 'v3')
+        pending = []
+        for document in _list_documents(service, query):
+            paths = _output_paths(document, mime_types, out_dir)
+            if manifest.get(document['id']) == document['modifiedTime'] and \
+                    all(os.path.exists(path) for path in paths.values()):
+                continue
+            pending.append((document, paths))
+        print(F'{len(pending)} documents changed since the last export.')
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = {executor.submit(_export, document, paths): document
+                       for document, paths in pending}
+            for future in concurrent.futures.as_completed(futures):
+                document = futures[future]
+                try:
+                    future.result()
+                except (HttpError, OSError) as error:
+                    print(F'An error occurred: {error}')
+                    continue
+                manifest[document['id']] = document['modifiedTime']
+                exported.append(document['id'])
+
+    except HttpError as error:
+        print(F'An error occurred: {error}')
+
+    finally:
+        json_state.save_json(manifest_path, manifest)
+
+    print(F'Exported {len(exported)} documents.')
+    return exported
+
+
+if __name__ == '__main__':
+    export_documents(real_folder_id='1jvTFoyBhUspwDncOTB25kb9k0Fl0EqeN',
+                     mime_types=('application/pdf', 'text/plain'))
+# [END drive_export_documents]
@@ -0,0 +1,49 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_json_state]
+
+from __future__ import print_function
+
+import json
+import os
+
+
+def load_json(path, default=None):
+    """Returns the JSON value stored at path, or default when the file is
+    missing or unreadable."""
+    try:
+        with open(path, encoding='utf-8') as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(path, value):
+    """Stores a JSON value at path atomically.
+
+    The value is written to a temporary file that then replaces path, so a
+    crash never leaves a truncated file behind.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as json_file:
+        json.dump(value, json_file)
+    os.replace(tmp_path, path)
+
+
+if __name__ == '__main__':
+    save_json('state.json', {'pageToken': '1'})
+    print(load_json('state.json'))
+# [END drive_json_state]
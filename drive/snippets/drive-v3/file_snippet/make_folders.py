@@ -0,0 +1,156 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_make_folders]
+
+from __future__ import print_function
+
+import collections
+import posixpath
+import threading
+
+import batch_executor
+import httplib2
+import json_state
+import page_iterator
+import service_cache
+from googleapiclient.errors import HttpError
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+# Parents combined into a single listing query.
+PARENTS_PER_QUERY = 50
+
+_lock = threading.Lock()
+# In-process cache of '<root ID>/<path>' to folder ID.
+_folder_ids = {}
+
+
+def _list_children(service, parent_ids):
+    """Returns {(parent ID, name): folder ID} for the parents' subfolders."""
+    children = {}
+    parent_ids = list(parent_ids)
+    for start in range(0, len(parent_ids), PARENTS_PER_QUERY):
+        chunk = parent_ids[start:start + PARENTS_PER_QUERY]
+        query = (F"mimeType='{FOLDER_MIME_TYPE}' and trashed=false and (" +
+                 ' or '.join(F"'{parent_id}' in parents"
+                             for parent_id in chunk) + ')')
+        # pylint: disable=maybe-no-member
+        for folder in page_iterator.iter_items(
+                service.files().list, 'files', fields='id, name, parents',
+                q=query, spaces='drive', pageSize=1000):
+            for parent_id in folder.get('parents', []):
+                children.setdefault((parent_id, folder['name']), folder['id'])
+    return children
+
+
+def _create_folder(name, parent_id):
+    def factory(service):
+        file_metadata = {
+            'name': name,
+            'mimeType': FOLDER_MIME_TYPE,
+            'parents': [parent_id]
+        }
+        # pylint: disable=maybe-no-member
+        return service.files().create(body=file_metadata, fields='id')
+    return factory
+
+
+def make_folders(paths, root_id='root', cache_path=None):
+    """Create folder trees like os.makedirs, for many paths at once.
+    Args:
+        paths: Iterable of '/'-separated folder paths, e.g. 'reports/2022'
+        root_id: ID of the folder the paths are relative to
+        cache_path: Optional JSON file persisting path to folder ID mappings
+            between runs
+    Returns : Dict mapping each path, and its ancestors, to a folder ID.
+
+    Each depth is resolved with one listing of the subfolders of every
+    parent at that depth, then the missing folders of that depth are
+    created with batch requests. Cached IDs are trusted, so remove the
+    cache file if folders were deleted outside this function.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    with _lock:
+        if cache_path:
+            _folder_ids.update(json_state.load_json(cache_path, {}))
+        folder_ids = {'': root_id}
+        levels = collections.defaultdict(set)
+        for path in paths:
+            parts = [part for part in posixpath.normpath(path).split('/')
+                     if part not in ('', '.')]
+            for depth in range(1, len(parts) + 1):
+                prefix = '/'.join(parts[:depth])
+                cached = _folder_ids.get(F'{root_id}/{prefix}')
+                if cached:
+                    folder_ids[prefix] = cached
+                else:
+                    levels[depth].add(prefix)
+
+    try:
+        service = service_cache.get_service('drive', 'v3')
+        if levels:
+            # Listed folders name their parents by ID, never by an alias
+            # such as 'root', so resolve the root before matching.
+            # pylint: disable=maybe-no-member
+            folder_ids[''] = service.files().get(
+                fileId=root_id, fields='id').execute().get('id')
+        for depth in sorted(levels):
+            missing = [path for path in sorted(levels[depth])
+                       if path not in folder_ids]
+            if not missing:
+                continue
+            parent_ids = {folder_ids[posixpath.dirname(path)]
+                          for path in missing}
+            children = _list_children(service, parent_ids)
+            to_create = []
+            for path in missing:
+                key = (folder_ids[posixpath.dirname(path)],
+                       posixpath.basename(path))
+                if key in children:
+                    folder_ids[path] = children[key]
+                else:
+                    to_create.append((path, key))
+            outcomes = batch_executor.execute_batched(
+                (path, _create_folder(name, parent_id))
+                for path, (parent_id, name) in to_create)
+            for path, outcome in outcomes.items():
+                if outcome.error is not None:
+                    raise outcome.error
+                print(F'Folder ID: "{outcome.response.get("id")}" ({path}).')
+                folder_ids[path] = outcome.response.get('id')
+
+    except (HttpError, OSError, httplib2.HttpLib2Error) as error:
+        print(F'An error occurred: {error}')
+        return None
+
+    finally:
+        with _lock:
+            _folder_ids.update((F'{root_id}/{path}', folder_id)
+                               for path, folder_id in folder_ids.items()
+                               if path)
+            if cache_path:
+                json_state.save_json(cache_path, _folder_ids)
+
+    del folder_ids['']
+    return folder_ids
+
+
+if __name__ == '__main__':
+    make_folders(paths=['Invoices/2022/March', 'Invoices/2022/April'],
+                 cache_path='folder_cache.json')
+# [END drive_make_folders]
@@ -0,0 +1,406 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_metadata_index]
+
+from __future__ import print_function
+
+import re
+import sqlite3
+import threading
+
+import page_iterator
+import service_cache
+from googleapiclient.errors import HttpError
+
+PAGE_SIZE = 1000
+FILE_FIELDS = ('id, name, mimeType, parents, modifiedTime, trashed, '
+               'md5Checksum, size, shortcutDetails(targetId)')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    mime_type TEXT,
+    modified_time TEXT,
+    trashed INTEGER,
+    md5_checksum TEXT,
+    size INTEGER,
+    shortcut_target_id TEXT
+);
+CREATE TABLE IF NOT EXISTS parents (
+    file_id TEXT,
+    parent_id TEXT,
+    PRIMARY KEY (file_id, parent_id)
+);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS files_name ON files (name);
+CREATE INDEX IF NOT EXISTS files_mime_type ON files (mime_type);
+CREATE INDEX IF NOT EXISTS files_modified_time ON files (modified_time);
+CREATE INDEX IF NOT EXISTS files_shortcut_target_id
+    ON files (shortcut_target_id);
+CREATE INDEX IF NOT EXISTS parents_parent_id ON parents (parent_id);
+"""
+
+# Query terms of the Drive `q` syntax mapped to index columns.
+COLUMNS = {
+    'name': 'name',
+    'mimeType': 'mime_type',
+    'modifiedTime': 'modified_time',
+    'trashed': 'trashed',
+}
+SELECT_FILES = ('SELECT id, name, mime_type, modified_time, trashed, '
+                'md5_checksum, size, shortcut_target_id, '
+                '(SELECT group_concat(parent_id) FROM parents '
+                'WHERE file_id = files.id) FROM files')
+OPERATORS = ('=', '!=', '<', '<=', '>', '>=')
+
+_TOKEN = re.compile(r"\s*(?:(\()|(\))|'((?:[^'\\]|\\.)*)'|(!=|<=|>=|=|<|>)"
+                    r"|(\w+))")
+
+
+def _tokenize(query):
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _TOKEN.match(query, position)
+        if not match or match.end() == position:
+            raise ValueError(F'Unsupported query near: {query[position:]}')
+        position = match.end()
+        lparen, rparen, string, operator, word = match.groups()
+        if string is not None:
+            tokens.append(('string', re.sub(r'\\(.)', r'\1', string)))
+        elif operator:
+            tokens.append(('op', operator))
+        else:
+            tokens.append(('word', lparen or rparen or word))
+    return tokens
+
+
+def _row_to_file(row):
+    file = {
+        'id': row[0],
+        'name': row[1],
+        'mimeType': row[2],
+        'modifiedTime': row[3],
+        'trashed': bool(row[4]),
+        'parents': row[8].split(',') if row[8] else [],
+    }
+    if row[5]:
+        file['md5Checksum'] = row[5]
+    if row[6] is not None:
+        file['size'] = str(row[6])
+    if row[7]:
+        file['shortcutDetails'] = {'targetId': row[7]}
+    return file
+
+
+class _QueryParser(object):
+    """Translates the common subset of the Drive query syntax to SQL.
+
+    Supports comparisons on name, mimeType, modifiedTime and trashed,
+    `name contains`, `'<id>' in parents`, and/or/not and parentheses.
+    As in Drive, `name contains` matches a prefix of the name, ignoring
+    letter case; SQLite only folds the case of ASCII letters.
+    """
+
+    def __init__(self, query):
+        self._tokens = _tokenize(query)
+        self._position = 0
+        self.params = []
+
+    def _peek(self):
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return (None, None)
+
+    def _next(self):
+        token = self._peek()
+        self._position += 1
+        return token
+
+    def _expect(self, kind, value=None):
+        token_kind, token_value = self._next()
+        if token_kind != kind or (value is not None and token_value != value):
+            raise ValueError(F'Expected {value or kind}, got {token_value}')
+        return token_value
+
+    def parse(self):
+        sql = self._or()
+        if self._peek()[0] is not None:
+            raise ValueError(F'Unexpected token: {self._peek()[1]}')
+        return sql
+
+    def _or(self):
+        terms = [self._and()]
+        while self._peek() == ('word', 'or'):
+            self._next()
+            terms.append(self._and())
+        return ' OR '.join(terms)
+
+    def _and(self):
+        factors = [self._not()]
+        while self._peek() == ('word', 'and'):
+            self._next()
+            factors.append(self._not())
+        return ' AND '.join(factors)
+
+    def _not(self):
+        if self._peek() == ('word', 'not'):
+            self._next()
+            return F'NOT ({self._not()})'
+        if self._peek() == ('word', '('):
+            self._next()
+            sql = self._or()
+            self._expect('word', ')')
+            return F'({sql})'
+        return self._comparison()
+
+    def _comparison(self):
+        kind, value = self._next()
+        if kind == 'string':
+            self._expect('word', 'in')
+            self._expect('word', 'parents')
+            self.params.append(value)
+            return 'id IN (SELECT file_id FROM parents WHERE parent_id = ?)'
+        if kind != 'word' or value not in COLUMNS:
+            raise ValueError(F'Unsupported query term: {value}')
+        column = COLUMNS[value]
+        operator = self._next()
+        if operator == ('word', 'contains') and column == 'name':
+            self.params.append(self._expect('string')
+                               .replace('\\', '\\\\').replace('%', '\\%')
+                               .replace('_', '\\_') + '%')
+            return F"{column} LIKE ? ESCAPE '\\'"
+        if operator[0] != 'op' or operator[1] not in OPERATORS:
+            raise ValueError(F'Unsupported operator: {operator[1]}')
+        operand_kind, operand = self._next()
+        if column == 'trashed' and operand in ('true', 'false'):
+            self.params.append(int(operand == 'true'))
+        elif operand_kind == 'string':
+            self.params.append(operand)
+        else:
+            raise ValueError(F'Unsupported value: {operand}')
+        operator = '<>' if operator[1] == '!=' else operator[1]
+        return F'{column} {operator} ?'
+
+
+class MetadataIndex(object):
+    """SQLite index of Drive file metadata, kept current from changes."""
+
+    def __init__(self, path=':memory:'):
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def upsert(self, files):
+        """Adds or replaces file resources returned by the Drive API."""
+        with self._lock, self._db:
+            self._write(files)
+
+    def _write(self, files):
+        for file in files:
+            self._db.execute(
+                'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (file['id'], file.get('name'), file.get('mimeType'),
+                 file.get('modifiedTime'), int(file.get('trashed', False)),
+                 file.get('md5Checksum'), file.get('size'),
+                 file.get('shortcutDetails', {}).get('targetId')))
+            self._db.execute('DELETE FROM parents WHERE file_id = ?',
+                             (file['id'],))
+            self._db.executemany(
+                'INSERT INTO parents VALUES (?, ?)',
+                [(file['id'], parent_id)
+                 for parent_id in file.get('parents', [])])
+
+    def remove(self, file_ids):
+        """Drops files from the index."""
+        with self._lock, self._db:
+            for file_id in file_ids:
+                self._db.execute('DELETE FROM files WHERE id = ?', (file_id,))
+                self._db.execute('DELETE FROM parents WHERE file_id = ?',
+                                 (file_id,))
+
+    def _get_state(self, key):
+        row = self._db.execute('SELECT value FROM state WHERE key = ?',
+                               (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key, value):
+        with self._db:
+            self._db.execute('INSERT OR REPLACE INTO state VALUES (?, ?)',
+                             (key, value))
+
+    def crawl(self, query='trashed = false'):
+        """Replaces the index with one paginated listing of all files.
+        Returns : Number of files indexed.
+
+        The index is rewritten in a single transaction, so files deleted
+        since an earlier crawl are dropped, and a failed crawl leaves the
+        previous contents in place. Searches wait until it completes.
+        """
+        service = service_cache.get_service('drive', 'v3')
+        # pylint: disable=maybe-no-member
+        # Take the start token first so no change made during the crawl
+        # is missed by the next sync.
+        start_token = service.changes().getStartPageToken().execute().get(
+            'startPageToken')
+        count = 0
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM files')
+            self._db.execute('DELETE FROM parents')
+            # The next page downloads while the current one is written.
+            for page in page_iterator.iter_pages(
+                    service.files().list, 'files', fields=FILE_FIELDS,
+                    q=query, spaces='drive', pageSize=PAGE_SIZE):
+                files = page.get('files', [])
+                self._write(files)
+                count += len(files)
+            self._db.execute('INSERT OR REPLACE INTO state VALUES (?, ?)',
+                             ('pageToken', start_token))
+        return count
+
+    def sync(self):
+        """Applies the changes made since the last crawl or sync.
+        Returns : Number of changes applied.
+        """
+        service = service_cache.get_service('drive', 'v3')
+        with self._lock:
+            page_token = self._get_state('pageToken')
+        if page_token is None:
+            return self.crawl()
+        count = 0
+        while page_token is not None:
+            # pylint: disable=maybe-no-member
+            response = service.changes().list(
+                pageToken=page_token, spaces='drive', pageSize=PAGE_SIZE,
+                fields=F'nextPageToken, newStartPageToken, '
+                       F'changes(changeType, fileId, removed, '
+                       F'file({FILE_FIELDS}))'
+            ).execute()
+            changes = response.get('changes', [])
+            # Shared drive changes have no fileId nor file to index.
+            file_changes = [change for change in changes
+                            if change.get('changeType', 'file') == 'file']
+            self.remove(change.get('fileId') for change in file_changes
+                        if change.get('removed') or
+                        change.get('file', {}).get('trashed'))
+            self.upsert(change['file'] for change in file_changes
+                        if not change.get('removed') and
+                        change.get('file') and
+                        not change['file'].get('trashed'))
+            count += len(changes)
+            page_token = response.get('nextPageToken')
+            with self._lock:
+                self._set_state('pageToken', page_token or
+                                response.get('newStartPageToken'))
+        return count
+
+    def search(self, query=None, limit=None):
+        """Searches the index with the Drive `q` syntax.
+        Args:
+            query: Query such as "mimeType='image/jpeg'", or None for all
+            limit: Maximum number of files returned
+        Returns : List of file resources shaped like the Drive API ones.
+        """
+        sql = SELECT_FILES
+        params = []
+        if query:
+            parser = _QueryParser(query)
+            sql += ' WHERE ' + parser.parse()
+            params = parser.params
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [_row_to_file(row) for row in rows]
+
+    def get(self, file_ids):
+        """Looks up files by ID.
+        Returns : Dict mapping the indexed IDs to their file resources.
+        """
+        file_ids = list(file_ids)
+        files = {}
+        # Stay below SQLite's limit on the number of bound parameters.
+        for start in range(0, len(file_ids), 500):
+            chunk = file_ids[start:start + 500]
+            sql = (SELECT_FILES + ' WHERE id IN (' +
+                   ', '.join('?' * len(chunk)) + ')')
+            with self._lock:
+                rows = self._db.execute(sql, chunk).fetchall()
+            for row in rows:
+                files[row[0]] = _row_to_file(row)
+        return files
+
+    def get_shortcuts(self, target_ids):
+        """Looks up the shortcuts pointing at the given targets.
+        Returns : Dict mapping (target ID, parent ID) to the shortcut ID.
+        """
+        target_ids = list(target_ids)
+        shortcuts = {}
+        for start in range(0, len(target_ids), 500):
+            chunk = target_ids[start:start + 500]
+            sql = ('SELECT files.shortcut_target_id, parents.parent_id, '
+                   'files.id FROM files JOIN parents '
+                   'ON parents.file_id = files.id '
+                   'WHERE NOT files.trashed AND files.shortcut_target_id '
+                   'IN (' + ', '.join('?' * len(chunk)) + ')')
+            with self._lock:
+                rows = self._db.execute(sql, chunk).fetchall()
+            for target_id, parent_id, shortcut_id in rows:
+                shortcuts[(target_id, parent_id)] = shortcut_id
+        return shortcuts
+
+
+def search_file(query, index_path='drive_index.db'):
+    """Search files in a local metadata index, syncing it first.
+    Args:
+        query: Drive query, e.g. "mimeType='image/jpeg'"
+        index_path: SQLite file holding the index
+    Returns : List of matching files.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    index = MetadataIndex(index_path)
+    try:
+        index.sync()
+        files = index.search(query)
+        for file in files:
+            print(F'Found file: {file.get("name")}, {file.get("id")}')
+
+    except HttpError as error:
+        print(F'An error occurred: {error}')
+        files = None
+
+    finally:
+        index.close()
+
+    return files
+
+
+if __name__ == '__main__':
+    search_file(query="mimeType='image/jpeg'")
+# [END drive_metadata_index]
@@ -0,0 +1,120 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_page_iterator]
+
+from __future__ import print_function
+
+import concurrent.futures
+
+import google_auth_httplib2
+import httplib2
+import service_cache
+from googleapiclient.errors import HttpError
+
+
+def _prefetch_http(request):
+    """Returns a transport owned by the prefetch thread, if possible."""
+    credentials = getattr(request.http, 'credentials', None)
+    if credentials is None:
+        return None
+    return google_auth_httplib2.AuthorizedHttp(credentials,
+                                               http=httplib2.Http())
+
+
+def iter_pages(method, items_key=None, fields=None, prefetch=True,
+               **kwargs):
+    """Yields the responses of a paginated list method.
+    Args:
+        method: List method of a collection, e.g. service.files().list
+        items_key: Response key holding the items, e.g. 'files'. Required
+            with fields.
+        fields: Optional projection of each item, e.g. 'id, name'
+        prefetch: Fetch the next page on a background thread while the
+            caller processes the current one
+        kwargs: Parameters of the list method
+    Yields : Each page of the response.
+
+    The prefetch thread executes requests with its own transport, since
+    httplib2 connections can not be shared between threads. Prefetching is
+    skipped for clients without google-auth credentials.
+    """
+    if fields:
+        kwargs['fields'] = F'nextPageToken, {items_key}({fields})'
+    request = method(**kwargs)
+    http = _prefetch_http(request) if prefetch else None
+    if http is None:
+        while True:
+            response = request.execute()
+            yield response
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return
+            request = method(pageToken=page_token, **kwargs)
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        future = executor.submit(request.execute, http=http)
+        while future is not None:
+            response = future.result()
+            page_token = response.get('nextPageToken')
+            future = None
+            if page_token:
+                request = method(pageToken=page_token, **kwargs)
+                future = executor.submit(request.execute, http=http)
+            yield response
+
+
+def iter_items(method, items_key, fields=None, prefetch=True, **kwargs):
+    """Yields the items of every page of a paginated list method.
+    Args:
+        method: List method of a collection, e.g. service.files().list
+        items_key: Response key holding the items, e.g. 'files'
+        fields: Optional projection of each item, e.g. 'id, name'
+        prefetch: Fetch the next page while the current one is consumed
+        kwargs: Parameters of the list method
+    Yields : Items, lazily, page after page.
+    """
+    for page in iter_pages(method, items_key, fields, prefetch, **kwargs):
+        for item in page.get(items_key, []):
+            yield item
+
+
+def search_file():
+    """Search file in drive location, prefetching the next page
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    try:
+        service = service_cache.get_service('drive', 'v3')
+        files = []
+        # pylint: disable=maybe-no-member
+        for file in iter_items(service.files().list, 'files',
+                               fields='id, name', q="mimeType='image/jpeg'",
+                               spaces='drive'):
+            print(F'Found file: {file.get("name")}, {file.get("id")}')
+            files.append(file)
+
+    except HttpError as error:
+        print(F'An error occurred: {error}')
+        files = None
+
+    return files
+
+
+if __name__ == '__main__':
+    search_file()
+# [END drive_page_iterator]
@@ -0,0 +1,199 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_request_scheduler]
+
+from __future__ import print_function
+
+import collections
+import random
+import threading
+import time
+
+import batch_executor
+import touch_file
+from googleapiclient import http as googleapiclient_http
+from googleapiclient.errors import HttpError
+
+MAX_CONCURRENCY = 16
+MAX_RETRIES = 5
+MAX_BACKOFF = 64
+# Concurrency is lowered at most once per interval, so a burst of
+# throttled responses to calls already in flight counts as one signal.
+DECREASE_INTERVAL = 1.0
+
+_original_execute = googleapiclient_http.HttpRequest.execute
+
+
+class _AdaptiveLimit(object):
+    """Concurrency limit that grows additively on success and halves when
+    the api throttles."""
+
+    def __init__(self, maximum, minimum=1):
+        self._maximum = maximum
+        self._minimum = minimum
+        self._limit = float(maximum)
+        self._active = 0
+        self._decreased = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self):
+        return int(self._limit)
+
+    def acquire(self):
+        with self._condition:
+            while self._active >= int(self._limit):
+                self._condition.wait()
+            self._active += 1
+
+    def release(self, throttled):
+        with self._condition:
+            self._active -= 1
+            now = time.monotonic()
+            if throttled:
+                if now - self._decreased >= DECREASE_INTERVAL:
+                    self._limit = max(self._minimum, self._limit / 2)
+                    self._decreased = now
+            else:
+                self._limit = min(self._maximum,
+                                  self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+
+def _api_name(request):
+    # methodId looks like 'drive.files.get' or 'sheets.spreadsheets.get'.
+    return (getattr(request, 'methodId', None) or '').split('.')[0]
+
+
+def _retry_delay(error, attempt):
+    """Honours Retry-After, else exponential backoff with full jitter."""
+    retry_after = error.resp.get('retry-after')
+    if retry_after and retry_after.isdigit():
+        return int(retry_after)
+    return random.uniform(0, min(2 ** attempt, MAX_BACKOFF))
+
+
+class Scheduler(object):
+    """Executes api requests under per-api rate and concurrency limits.
+
+    Calls that fail with a rate limit or transient error are retried with
+    exponential backoff and jitter. Every throttled response halves the
+    number of calls the api may have in flight, which then grows back by
+    one call per round of successful calls.
+    """
+
+    def __init__(self, rate_limits=None, max_concurrency=MAX_CONCURRENCY,
+                 max_retries=MAX_RETRIES):
+        """
+        Args:
+            rate_limits: Optional dict mapping an api name, e.g. 'sheets',
+                to the maximum calls per second matching its quota
+            max_concurrency: Maximum calls in flight per api
+            max_retries: Retries of calls that failed with a rate limit or
+                transient error
+        """
+        self._rate_limits = dict(rate_limits or {})
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._lock = threading.Lock()
+        self._limiters = {}
+        self._limits = {}
+        self._stats = collections.defaultdict(collections.Counter)
+
+    def _get_limits(self, api):
+        with self._lock:
+            if api not in self._limits:
+                rate = self._rate_limits.get(api)
+                self._limiters[api] = (batch_executor.RateLimiter(rate)
+                                       if rate else None)
+                self._limits[api] = _AdaptiveLimit(self._max_concurrency)
+            return self._limiters[api], self._limits[api]
+
+    def execute(self, request, http=None, num_retries=0):
+        """Executes an HttpRequest under the limits of its api.
+        Args:
+            request: HttpRequest built by a service object
+            http: Optional transport to use instead of the request's own
+            num_retries: Retries of the client library itself, per attempt
+        Returns : The deserialized response.
+        """
+        api = _api_name(request)
+        limiter, limit = self._get_limits(api)
+        for attempt in range(self._max_retries + 1):
+            if limiter is not None:
+                limiter.acquire()
+            limit.acquire()
+            throttled = False
+            try:
+                response = _original_execute(request, http=http,
+                                             num_retries=num_retries)
+            except HttpError as error:
+                retryable = batch_executor.is_retryable(error)
+                throttled = retryable and error.resp.status in (403, 429)
+                with self._lock:
+                    self._stats[api]['throttled'] += throttled
+                if not retryable or attempt == self._max_retries:
+                    with self._lock:
+                        self._stats[api]['failed'] += 1
+                    raise
+                with self._lock:
+                    self._stats[api]['retries'] += 1
+                delay = _retry_delay(error, attempt)
+            else:
+                with self._lock:
+                    self._stats[api]['calls'] += 1
+                return response
+            finally:
+                limit.release(throttled)
+            time.sleep(delay)
+        return None
+
+    def stats(self):
+        """Returns {api: counters} of calls, retries, throttled and failed
+        calls, and the current concurrency limit."""
+        with self._lock:
+            return {api: dict(counter, concurrency=self._limits[api].limit)
+                    for api, counter in self._stats.items()}
+
+
+def install(scheduler=None):
+    """Routes HttpRequest.execute of every client through a scheduler.
+    Args:
+        scheduler: Scheduler to use, a default one is created if omitted
+    Returns : The installed scheduler.
+
+    Existing snippets such as share_file gain rate limiting and retries
+    without changes, since they keep calling request.execute().
+    """
+    scheduler = scheduler or Scheduler()
+
+    def execute(request, http=None, num_retries=0):
+        return scheduler.execute(request, http=http, num_retries=num_retries)
+
+    googleapiclient_http.HttpRequest.execute = execute
+    return scheduler
+
+
+def uninstall():
+    """Restores the unscheduled HttpRequest.execute."""
+    googleapiclient_http.HttpRequest.execute = _original_execute
+
+
+if __name__ == '__main__':
+    install(Scheduler(rate_limits={'drive': 10}))
+    touch_file.touch_file(real_file_id='17EqlSf7FpPU95SS00sICyVzQHpeET1cz',
+                          real_timestamp='2022-03-02T05:43:27.504Z')
+# [END drive_request_scheduler]
@@ -0,0 +1,131 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_service_cache]
+
+from __future__ import print_function
+
+import collections
+import threading
+
+import google.auth
+import google_auth_httplib2
+import httplib2
+from google.auth.exceptions import RefreshError
+from googleapiclient.discovery import build
+
+# Maximum number of (api, version, scopes, credentials) clients kept alive.
+MAX_SERVICES = 32
+
+_lock = threading.RLock()
+_credentials = {}
+_services = collections.OrderedDict()
+
+
+def _scopes_key(scopes):
+    if scopes is None:
+        return ()
+    if isinstance(scopes, str):
+        return (scopes,)
+    return tuple(sorted(scopes))
+
+
+def get_credentials(scopes=None):
+    """Returns process-wide application default credentials.
+    Args:
+        scopes: Optional scope or list of scopes to request.
+    Returns : Credentials, discovered once per set of scopes.
+
+    Credentials that can no longer be refreshed are dropped together with
+    every client built from them, and discovered again.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    key = _scopes_key(scopes)
+    with _lock:
+        creds = _credentials.get(key)
+    if creds is not None and not creds.valid:
+        try:
+            creds.refresh(google_auth_httplib2.Request(httplib2.Http()))
+        except RefreshError as error:
+            print(F'Discarding cached credentials: {error}')
+            invalidate(creds)
+            creds = None
+    if creds is None:
+        creds, _ = google.auth.default(scopes=list(key) or None)
+        with _lock:
+            creds = _credentials.setdefault(key, creds)
+    return creds
+
+
+def get_service(api, version, scopes=None, credentials=None):
+    """Returns a cached api client for the calling thread.
+    Args:
+        api: Name of the api, e.g. 'drive'.
+        version: Version of the api, e.g. 'v3'.
+        scopes: Optional scope or list of scopes for default credentials.
+        credentials: Optional credentials to use instead of the defaults.
+    Returns : Service object built by googleapiclient.discovery.build.
+
+    httplib2 transports are not thread-safe, so each thread receives its
+    own client for a given key. Build requests on the thread that executes
+    them. The least recently used keys are evicted past MAX_SERVICES.
+    """
+    if credentials is None:
+        credentials = get_credentials(scopes)
+    key = (api, version, _scopes_key(scopes), id(credentials))
+    with _lock:
+        entry = _services.get(key)
+        if entry is None:
+            # Keep a reference to the credentials so their id stays unique.
+            entry = (credentials, threading.local())
+            _services[key] = entry
+        _services.move_to_end(key)
+        while len(_services) > MAX_SERVICES:
+            _services.popitem(last=False)
+    local = entry[1]
+    service = getattr(local, 'service', None)
+    if service is None:
+        service = build(api, version, credentials=credentials,
+                        cache_discovery=False)
+        local.service = service
+    return service
+
+
+def invalidate(credentials=None):
+    """Drops cached clients.
+    Args:
+        credentials: Only drop clients built with these credentials. All
+            cached clients and credentials are dropped when omitted.
+    """
+    with _lock:
+        if credentials is None:
+            _credentials.clear()
+            _services.clear()
+            return
+        for key in [key for key, creds in _credentials.items()
+                    if creds is credentials]:
+            del _credentials[key]
+        for key in [key for key, entry in _services.items()
+                    if entry[0] is credentials]:
+            del _services[key]
+
+
+if __name__ == '__main__':
+    # Repeated lookups return the same client without rebuilding it.
+    print(get_service('drive', 'v3') is get_service('drive', 'v3'))
+# [END drive_service_cache]
@@ -0,0 +1,148 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_stream_download]
+
+from __future__ import print_function
+
+import concurrent.futures
+import os
+
+import service_cache
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload
+
+CHUNK_SIZE = 16 * 1024 * 1024
+SEGMENTS = 8
+
+
+def _stream(request, file, chunk_size):
+    downloader = MediaIoBaseDownload(file, request, chunksize=chunk_size)
+    done = False
+    while done is False:
+        status, done = downloader.next_chunk()
+        print(F'Download {int(status.progress() * 100)}.')
+    # Pipes and sockets can not tell(), count what the downloader received.
+    return status.resumable_progress
+
+
+def download_to(real_file_id, destination, mime_type=None,
+                chunk_size=CHUNK_SIZE):
+    """Streams a file, or its export, to disk chunk by chunk.
+    Args:
+        real_file_id: ID of the file to download
+        destination: Local path or writable binary file object
+        mime_type: Export to this mimeType, for Google Workspace documents
+        chunk_size: Bytes requested per chunk
+    Returns : Number of bytes written.
+
+    Only one chunk is held in memory at a time, whatever the file size.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    try:
+        service = service_cache.get_service('drive', 'v3')
+
+        # pylint: disable=maybe-no-member
+        if mime_type:
+            request = service.files().export_media(fileId=real_file_id,
+                                                   mimeType=mime_type)
+        else:
+            request = service.files().get_media(fileId=real_file_id)
+        if isinstance(destination, str):
+            with open(destination, 'wb') as file:
+                size = _stream(request, file, chunk_size)
+        else:
+            size = _stream(request, destination, chunk_size)
+
+    except HttpError as error:
+        print(F'An error occurred: {error}')
+        size = None
+
+    return size
+
+
+def _fetch_segment(file_id, fd, start, end, chunk_size):
+    """Writes bytes start..end (inclusive) of the file at their offset."""
+    service = service_cache.get_service('drive', 'v3')
+    offset = start
+    while offset <= end:
+        last = min(offset + chunk_size, end + 1) - 1
+        # pylint: disable=maybe-no-member
+        request = service.files().get_media(fileId=file_id)
+        request.headers['Range'] = F'bytes={offset}-{last}'
+        statuses = []
+        request.add_response_callback(
+            lambda resp: statuses.append(resp.status))
+        content = request.execute()
+        # A 200 is the whole file, written at offset it would corrupt it.
+        if statuses != [206] or not content or \
+                len(content) > last - offset + 1:
+            raise IOError(F'Unexpected response for bytes {offset}-{last}: '
+                          F'status {statuses}, {len(content)} bytes')
+        os.pwrite(fd, content, offset)
+        offset += len(content)
+    return end - start + 1
+
+
+def download_ranged(real_file_id, path, segments=SEGMENTS,
+                    chunk_size=CHUNK_SIZE):
+    """Downloads a binary file as concurrent HTTP Range segments.
+    Args:
+        real_file_id: ID of the file to download
+        path: Local path of the preallocated output file
+        segments: Number of segments fetched concurrently
+        chunk_size: Bytes requested per Range request within a segment
+    Returns : Number of bytes written.
+
+    Google Workspace documents have no size and must be exported with
+    download_to instead.
+    """
+    try:
+        service = service_cache.get_service('drive', 'v3')
+        # pylint: disable=maybe-no-member
+        size = int(service.files().get(fileId=real_file_id,
+                                       fields='size').execute()['size'])
+        segment_size = max(-(-size // segments), 1)
+
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            with concurrent.futures.ThreadPoolExecutor(segments) as executor:
+                futures = [
+                    executor.submit(_fetch_segment, real_file_id, fd, start,
+                                    min(start + segment_size, size) - 1,
+                                    chunk_size)
+                    for start in range(0, size, segment_size)]
+                written = sum(future.result() for future in futures)
+        finally:
+            os.close(fd)
+        print(F'Downloaded {written} bytes in {len(futures)} segments.')
+
+    except HttpError as error:
+        print(F'An error occurred: {error}')
+        written = None
+
+    return written
+
+
+if __name__ == '__main__':
+    download_to(real_file_id='1KuPmvGq8yoYgbfW74OENMCB5H0n_2Jm9',
+                destination='photo.jpg')
+    download_ranged(real_file_id='1KuPmvGq8yoYgbfW74OENMCB5H0n_2Jm9',
+                    path='photo.jpg')
+# [END drive_stream_download]
@@ -0,0 +1,107 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_sync_revisions]
+
+from __future__ import print_function
+
+import concurrent.futures
+import mimetypes
+import os
+
+import json_state
+import service_cache
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload
+from upload_directory import file_md5
+
+MAX_WORKERS = 8
+
+
+def _sync_one(file_id, path, entry):
+    """Uploads a revision if the content changed.
+    Returns : (new manifest entry, whether a revision was created).
+    """
+    stat = os.stat(path)
+    if entry and entry['size'] == stat.st_size and \
+            entry['mtime'] == stat.st_mtime:
+        return entry, False
+    new_entry = {'size': stat.st_size, 'mtime': stat.st_mtime,
+                 'md5': file_md5(path)}
+    service = service_cache.get_service('drive', 'v3')
+    if entry is None:
+        # First sync of this file, compare against the current revision.
+        # pylint: disable=maybe-no-member
+        remote = service.files().get(fileId=file_id,
+                                     fields='md5Checksum').execute()
+        entry = {'md5': remote.get('md5Checksum')}
+    if entry.get('md5') == new_entry['md5']:
+        return new_entry, False
+    mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    media = MediaFileUpload(path, mimetype=mimetype, resumable=True)
+    # pylint: disable=maybe-no-member
+    service.files().update(fileId=file_id, body={}, media_body=media,
+                           fields='id').execute()
+    return new_entry, True
+
+
+def sync_revisions(real_revisions, manifest_path='revision_manifest.json',
+                   max_workers=MAX_WORKERS):
+    """Upload new revisions only for the files whose content changed.
+    Args:
+        real_revisions: Dict mapping file IDs to the local file to upload
+        manifest_path: JSON manifest of the size, mtime and MD5 last synced
+            for each file ID
+        max_workers: Number of files checked and uploaded concurrently
+    Returns : List of the file IDs that received a new revision.
+
+    Files whose size and mtime match the manifest are skipped without
+    being read. Otherwise the MD5 decides whether to upload.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    manifest = json_state.load_json(manifest_path, {})
+    revised = []
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = {
+                executor.submit(_sync_one, file_id, path,
+                                manifest.get(file_id)): file_id
+                for file_id, path in real_revisions.items()}
+            for future in concurrent.futures.as_completed(futures):
+                file_id = futures[future]
+                try:
+                    entry, uploaded = future.result()
+                except (HttpError, OSError) as error:
+                    print(F'An error occurred syncing {file_id}: {error}')
+                    continue
+                manifest[file_id] = entry
+                if uploaded:
+                    print(F'File ID: {file_id} has a new revision.')
+                    revised.append(file_id)
+
+    finally:
+        json_state.save_json(manifest_path, manifest)
+
+    print(F'{len(revised)} of {len(real_revisions)} files changed.')
+    return revised
+
+
+if __name__ == '__main__':
+    sync_revisions(real_revisions={
+        '1jJTiihczk_xSNPVLwMySQBJACXYdpGTi': 'download.jpeg'})
+# [END drive_sync_revisions]
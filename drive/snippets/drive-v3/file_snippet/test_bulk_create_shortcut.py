@@ -0,0 +1,40 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import tempfile
+import unittest
+
+import bulk_create_shortcut
+
+
+class TestBulkCreateShortcut(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def test_bulk_create_shortcut(self):
+        """Test bulk_create_shortcut is idempotent"""
+        link = ('1KuPmvGq8yoYgbfW74OENMCB5H0n_2Jm9',
+                '1jvTFoyBhUspwDncOTB25kb9k0Fl0EqeN')
+        with tempfile.TemporaryDirectory() as state_dir:
+            index_path = os.path.join(state_dir, 'drive_index.db')
+            shortcuts = bulk_create_shortcut.bulk_create_shortcut(
+                links=[link], index_path=index_path)
+            self.assertIsNotNone(shortcuts[link])
+            self.assertEqual(shortcuts, bulk_create_shortcut.
+                             bulk_create_shortcut(links=[link],
+                                                  index_path=index_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
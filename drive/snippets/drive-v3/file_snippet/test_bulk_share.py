@@ -0,0 +1,42 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+
+import bulk_share
+
+
+class TestBulkShare(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    @classmethod
+    def test_bulk_share(cls):
+        """Test bulk_share"""
+        real_file_id = '1dUiRSoAQKkM3a4nTPeNQWgiuau1KdQ_l'
+        real_user = 'gduser1@workspacesamples.dev'
+        real_domain = 'workspacesamples.dev'
+        results = bulk_share.bulk_share(real_shares=[
+            (real_file_id, {'type': 'user', 'role': 'writer',
+                            'emailAddress': real_user}),
+            (real_file_id, {'type': 'domain', 'role': 'reader',
+                            'domain': real_domain}),
+        ])
+        cls.assertEqual(cls, 2, len(results))
+        for _, _, permission_id, error in results:
+            cls.assertIsNone(cls, error)
+            cls.assertIsNotNone(cls, permission_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+
+import bulk_touch_file
+
+
+class TestBulkTouchFile(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def test_coalesce(self):
+        """Test coalesce merges updates per file"""
+        bodies = bulk_touch_file.coalesce([
+            ('a', {'modifiedTime': '2022-01-01T00:00:00Z',
+                   'appProperties': {'x': '1'}}),
+            ('a', {'modifiedTime': '2022-03-02T05:43:27.504Z',
+                   'appProperties': {'y': '2'}}),
+            ('b', {'description': 'report'}),
+        ])
+        self.assertEqual({
+            'a': {'modifiedTime': '2022-03-02T05:43:27.504Z',
+                  'appProperties': {'x': '1', 'y': '2'}},
+            'b': {'description': 'report'},
+        }, bodies)
+
+    def test_bulk_touch_file(self):
+        """Test bulk_touch_file"""
+        real_file_id = '17EqlSf7FpPU95SS00sICyVzQHpeET1cz'
+        real_timestamp = '2022-03-02T05:43:27.504Z'
+        files = bulk_touch_file.bulk_touch_file(
+            real_updates=[(real_file_id, {'modifiedTime': real_timestamp})],
+            rate_limit=10)
+        self.assertEqual(real_timestamp,
+                         files[real_file_id].get('modifiedTime'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import tempfile
+import unittest
+
+import export_documents
+
+
+class TestExportDocuments(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def test_export_documents(self):
+        """Test export_documents only re-exports changed documents"""
+        real_folder_id = '1jvTFoyBhUspwDncOTB25kb9k0Fl0EqeN'
+        with tempfile.TemporaryDirectory() as out_dir:
+            exported = export_documents.export_documents(
+                real_folder_id=real_folder_id, out_dir=out_dir)
+            self.assertIsNotNone(exported)
+            self.assertEqual([], export_documents.export_documents(
+                real_folder_id=real_folder_id, out_dir=out_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
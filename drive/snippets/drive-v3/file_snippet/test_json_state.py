@@ -0,0 +1,41 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import tempfile
+import unittest
+
+import json_state
+
+
+class TestJsonState(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def test_save_and_load(self):
+        """Test save_json stores a value load_json reads back"""
+        with tempfile.TemporaryDirectory() as state_dir:
+            path = os.path.join(state_dir, 'state.json')
+            json_state.save_json(path, {'a': [1, 2]})
+            self.assertEqual({'a': [1, 2]}, json_state.load_json(path))
+            self.assertEqual(['state.json'], os.listdir(state_dir))
+
+    def test_load_missing(self):
+        """Test load_json returns the default for a missing file"""
+        with tempfile.TemporaryDirectory() as state_dir:
+            path = os.path.join(state_dir, 'missing.json')
+            self.assertEqual({}, json_state.load_json(path, {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
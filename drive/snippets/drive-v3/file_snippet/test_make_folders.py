@@ -0,0 +1,45 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import tempfile
+import unittest
+
+import make_folders
+
+
+class TestMakeFolders(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def test_make_folders(self):
+        """Test make_folders creates once and then reuses folders"""
+        paths = ['Invoices/2022/March', 'Invoices/2022/April']
+        with tempfile.TemporaryDirectory() as state_dir:
+            cache_path = os.path.join(state_dir, 'folder_cache.json')
+            folder_ids = make_folders.make_folders(paths=paths,
+                                                   cache_path=cache_path)
+            self.assertEqual(4, len(folder_ids))
+            self.assertEqual(folder_ids, make_folders.make_folders(
+                paths=paths, cache_path=cache_path))
+
+    def test_make_folders_without_cache(self):
+        """Test make_folders finds existing folders under 'root' by listing"""
+        paths = ['Invoices/2022/March']
+        folder_ids = make_folders.make_folders(paths=paths)
+        make_folders._folder_ids.clear()  # pylint: disable=protected-access
+        self.assertEqual(folder_ids, make_folders.make_folders(paths=paths))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+
+import metadata_index
+
+
+class TestMetadataIndex(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def setUp(self):
+        self.index = metadata_index.MetadataIndex()
+        self.index.upsert([
+            {'id': 'photo', 'name': 'photo.jpg', 'mimeType': 'image/jpeg',
+             'parents': ['folder'], 'modifiedTime': '2022-03-02T05:43:27Z'},
+            {'id': 'report', 'name': 'report.csv', 'mimeType': 'text/csv',
+             'parents': ['folder', 'archive'],
+             'modifiedTime': '2021-01-01T00:00:00Z'},
+        ])
+
+    def tearDown(self):
+        self.index.close()
+
+    def test_search(self):
+        """Test search with the Drive query syntax"""
+        files = self.index.search("mimeType='image/jpeg'")
+        self.assertEqual(['photo'], [file['id'] for file in files])
+        files = self.index.search("'archive' in parents or "
+                                  "name contains 'phot'")
+        self.assertEqual(2, len(files))
+        files = self.index.search("'folder' in parents and "
+                                  "modifiedTime > '2022-01-01T00:00:00'")
+        self.assertEqual(['photo'], [file['id'] for file in files])
+
+    def test_name_contains(self):
+        """Test name contains matches a prefix, like Drive"""
+        files = self.index.search("name contains 'PHOT'")
+        self.assertEqual(['photo'], [file['id'] for file in files])
+        self.assertEqual([], self.index.search("name contains 'oto'"))
+
+    def test_remove(self):
+        """Test remove drops files from the index"""
+        self.index.remove(['photo'])
+        self.assertEqual(['report'],
+                         [file['id'] for file in self.index.search()])
+
+    def test_unsupported_query(self):
+        """Test unsupported terms are rejected"""
+        with self.assertRaises(ValueError):
+            self.index.search("fullText contains 'hello'")
+
+    def test_search_file(self):
+        """Test search_file"""
+        files = metadata_index.search_file(query="mimeType='image/jpeg'",
+                                           index_path=':memory:')
+        self.assertIsNotNone(files)
+
+
+if __name__ == '__main__':
+    unittest.main()
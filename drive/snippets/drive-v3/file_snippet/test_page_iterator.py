@@ -0,0 +1,43 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+
+import page_iterator
+import service_cache
+
+
+class TestPageIterator(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def test_iter_items(self):
+        """Test iter_items yields the same files with and without prefetch"""
+        service = service_cache.get_service('drive', 'v3')
+        # pylint: disable=maybe-no-member
+        prefetched = list(page_iterator.iter_items(
+            service.files().list, 'files', fields='id, name', pageSize=10,
+            q="mimeType='image/jpeg'"))
+        sequential = list(page_iterator.iter_items(
+            service.files().list, 'files', fields='id, name', pageSize=10,
+            q="mimeType='image/jpeg'", prefetch=False))
+        self.assertEqual(sequential, prefetched)
+
+    def test_search_file(self):
+        """Test search_file"""
+        files = page_iterator.search_file()
+        self.assertNotEqual(0, len(files))
+
+
+if __name__ == '__main__':
+    unittest.main()
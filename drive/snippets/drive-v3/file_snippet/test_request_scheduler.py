@@ -0,0 +1,54 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+
+import request_scheduler
+import touch_file
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpMockSequence
+
+
+class TestRequestScheduler(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def test_retry_throttled(self):
+        """Test a throttled call is retried and lowers concurrency"""
+        http = HttpMockSequence([
+            ({'status': '429', 'retry-after': '0'}, '{}'),
+            ({'status': '200'}, '{"id": "1"}'),
+        ])
+        service = build('drive', 'v3', http=http)
+        scheduler = request_scheduler.Scheduler(max_concurrency=8)
+        response = scheduler.execute(service.files().get(fileId='1'))
+        self.assertEqual('1', response.get('id'))
+        stats = scheduler.stats()['drive']
+        self.assertEqual(1, stats['retries'])
+        self.assertEqual(1, stats['throttled'])
+        self.assertEqual(4, stats['concurrency'])
+
+    def test_install(self):
+        """Test existing snippets run through the installed scheduler"""
+        scheduler = request_scheduler.install()
+        try:
+            touch_file.touch_file(
+                real_file_id='17EqlSf7FpPU95SS00sICyVzQHpeET1cz',
+                real_timestamp='2022-03-02T05:43:27.504Z')
+        finally:
+            request_scheduler.uninstall()
+        self.assertEqual(1, scheduler.stats()['drive']['calls'])
+
+
+if __name__ == '__main__':
+    unittest.main()
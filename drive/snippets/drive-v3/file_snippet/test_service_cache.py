@@ -0,0 +1,50 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import threading
+import unittest
+
+import service_cache
+
+
+class TestServiceCache(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def setUp(self):
+        service_cache.invalidate()
+
+    def test_get_service(self):
+        """Test get_service returns the cached client"""
+        service = service_cache.get_service('drive', 'v3')
+        self.assertIs(service, service_cache.get_service('drive', 'v3'))
+
+    def test_get_service_per_thread(self):
+        """Test get_service builds one client per thread"""
+        services = []
+        thread = threading.Thread(target=lambda: services.append(
+            service_cache.get_service('drive', 'v3')))
+        thread.start()
+        thread.join()
+        self.assertIsNot(services[0],
+                         service_cache.get_service('drive', 'v3'))
+
+    def test_invalidate(self):
+        """Test invalidate drops cached clients"""
+        service = service_cache.get_service('drive', 'v3')
+        service_cache.invalidate(service_cache.get_credentials())
+        self.assertIsNot(service, service_cache.get_service('drive', 'v3'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import io
+import os
+import tempfile
+import unittest
+
+import stream_download
+
+
+class TestStreamDownload(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def test_download_to(self):
+        """Test download_to"""
+        real_file_id = '1KuPmvGq8yoYgbfW74OENMCB5H0n_2Jm9'
+        file = io.BytesIO()
+        size = stream_download.download_to(real_file_id=real_file_id,
+                                           destination=file)
+        self.assertNotEqual(0, size)
+        self.assertEqual(size, len(file.getvalue()))
+
+    def test_download_ranged(self):
+        """Test download_ranged matches a streamed download"""
+        real_file_id = '1KuPmvGq8yoYgbfW74OENMCB5H0n_2Jm9'
+        file = io.BytesIO()
+        stream_download.download_to(real_file_id=real_file_id,
+                                    destination=file)
+        with tempfile.TemporaryDirectory() as local_dir:
+            path = os.path.join(local_dir, 'photo.jpg')
+            size = stream_download.download_ranged(
+                real_file_id=real_file_id, path=path, segments=4,
+                chunk_size=256 * 1024)
+            with open(path, 'rb') as downloaded:
+                self.assertEqual(file.getvalue(), downloaded.read())
+        self.assertEqual(len(file.getvalue()), size)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import sync_revisions
+
+
+class TestSyncRevisions(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def test_sync_revisions(self):
+        """Test sync_revisions only uploads changed content"""
+        real_file_id = '1jJTiihczk_xSNPVLwMySQBJACXYdpGTi'
+        with tempfile.TemporaryDirectory() as state_dir:
+            path = os.path.join(state_dir, 'download.jpeg')
+            shutil.copy('download.jpeg', path)
+            manifest_path = os.path.join(state_dir, 'manifest.json')
+            sync_revisions.sync_revisions(
+                real_revisions={real_file_id: path},
+                manifest_path=manifest_path)
+            revised = sync_revisions.sync_revisions(
+                real_revisions={real_file_id: path},
+                manifest_path=manifest_path)
+            self.assertEqual([], revised)
+            with open(path, 'ab') as file:
+                file.write(b'\0')
+            revised = sync_revisions.sync_revisions(
+                real_revisions={real_file_id: path},
+                manifest_path=manifest_path)
+            self.assertEqual([real_file_id], revised)
+
+
+if __name__ == '__main__':
+    unittest.main()
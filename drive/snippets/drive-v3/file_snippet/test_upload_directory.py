@@ -0,0 +1,87 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import tempfile
+import unittest
+
+import upload_directory
+
+
+class TestUploadDirectory(unittest.TestCase):
+    """Unit test class for file snippet"""
+
+    def test_upload_directory(self):
+        """Test upload_directory"""
+        real_folder_id = '1s0oKEZZXjImNngxHGnY0xed6Mw-tvspu'
+        with tempfile.TemporaryDirectory() as local_dir:
+            for name in ('report1.csv', 'report2.csv'):
+                with open(os.path.join(local_dir, name), 'w',
+                          encoding='utf-8') as report:
+                    report.write('a,b\n1,2\n')
+            file_ids, stats = upload_directory.upload_directory(
+                real_folder_id=real_folder_id, local_dir=local_dir,
+                session_dir=os.path.join(local_dir, 'sessions'))
+        self.assertEqual(2, len(file_ids))
+        self.assertNotIn(None, file_ids.values())
+        self.assertEqual(2, stats.files)
+        self.assertEqual(0, stats.failed)
+
+    def test_upload_directory_deduplicate(self):
+        """Test deduplicate skips files already in the folder"""
+        real_folder_id = '1s0oKEZZXjImNngxHGnY0xed6Mw-tvspu'
+        with tempfile.TemporaryDirectory() as local_dir:
+            with open(os.path.join(local_dir, 'report.csv'), 'w',
+                      encoding='utf-8') as report:
+                report.write('a,b\n3,4\n')
+            session_dir = os.path.join(local_dir, 'sessions')
+            file_ids, _ = upload_directory.upload_directory(
+                real_folder_id=real_folder_id, local_dir=local_dir,
+                session_dir=session_dir, deduplicate=True)
+            file_ids_again, stats = upload_directory.upload_directory(
+                real_folder_id=real_folder_id, local_dir=local_dir,
+                session_dir=session_dir, deduplicate=True)
+        self.assertEqual(file_ids, file_ids_again)
+        self.assertEqual(0, stats.files)
+        self.assertEqual(1, stats.skipped)
+
+    def test_upload_directory_link_duplicates(self):
+        """Test link_duplicates reuses the shortcut of an earlier run"""
+        real_folder_id = '1s0oKEZZXjImNngxHGnY0xed6Mw-tvspu'
+        with tempfile.TemporaryDirectory() as local_dir:
+            for name in ('report.csv', 'copy.csv'):
+                with open(os.path.join(local_dir, name), 'w',
+                          encoding='utf-8') as report:
+                    report.write('a,b\n5,6\n')
+            session_dir = os.path.join(local_dir, 'sessions')
+            upload_directory.upload_directory(
+                real_folder_id=real_folder_id, local_dir=local_dir,
+                session_dir=session_dir)
+            os.remove(os.path.join(local_dir, 'report.csv'))
+            os.rename(os.path.join(local_dir, 'copy.csv'),
+                      os.path.join(local_dir, 'link.csv'))
+            file_ids, _ = upload_directory.upload_directory(
+                real_folder_id=real_folder_id, local_dir=local_dir,
+                session_dir=session_dir, deduplicate=True,
+                link_duplicates=True)
+            file_ids_again, stats = upload_directory.upload_directory(
+                real_folder_id=real_folder_id, local_dir=local_dir,
+                session_dir=session_dir, deduplicate=True,
+                link_duplicates=True)
+        self.assertEqual(file_ids, file_ids_again)
+        self.assertEqual(1, stats.skipped)
+
+
+if __name__ == '__main__':
+    unittest.main()
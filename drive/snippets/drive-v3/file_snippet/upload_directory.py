@@ -0,0 +1,268 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START drive_upload_directory]
+
+from __future__ import print_function
+
+import collections
+import concurrent.futures
+import hashlib
+import mimetypes
+import os
+import time
+
+import json_state
+import page_iterator
+import service_cache
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload
+
+SHORTCUT_MIME_TYPE = 'application/vnd.google-apps.shortcut'
+# Resumable chunks must be a multiple of 256 KB.
+CHUNK_SIZE = 32 * 256 * 1024
+MAX_WORKERS = 8
+SESSION_DIR = '.upload_sessions'
+
+UploadStats = collections.namedtuple(
+    'UploadStats', ['files', 'skipped', 'failed', 'bytes', 'bytes_skipped',
+                    'seconds', 'bytes_per_second', 'mean_latency',
+                    'max_latency'])
+
+
+def file_md5(path, block_size=1024 * 1024):
+    """Returns the hex MD5 of a local file, read in a streaming pass."""
+    digest = hashlib.md5()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _list_checksums(service, folder_id):
+    """Returns {md5Checksum: [(name, file ID)]} for a folder's files and
+    {name: {target ID: shortcut ID}} for its shortcuts."""
+    checksums = collections.defaultdict(list)
+    shortcuts = collections.defaultdict(dict)
+    # pylint: disable=maybe-no-member
+    for file in page_iterator.iter_items(
+            service.files().list, 'files',
+            fields='id, name, md5Checksum, shortcutDetails(targetId)',
+            q=F"'{folder_id}' in parents and trashed=false", spaces='drive',
+            pageSize=1000):
+        if file.get('md5Checksum'):
+            checksums[file['md5Checksum']].append((file['name'], file['id']))
+        elif file.get('shortcutDetails', {}).get('targetId'):
+            # Shortcuts have no checksum of their own.
+            shortcuts[file['name']][file['shortcutDetails']['targetId']] = \
+                file['id']
+    return checksums, shortcuts
+
+
+def _session_path(session_dir, path):
+    digest = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+    return os.path.join(session_dir, digest + '.json')
+
+
+def _load_session(session_path, stat, file_metadata):
+    session = json_state.load_json(session_path)
+    if session is None:
+        return None
+    # Only resume when the local file has not changed since the crash, and
+    # the upload still goes to the same folder with the same conversion.
+    if session.get('size') != stat.st_size or \
+            session.get('mtime') != stat.st_mtime or \
+            session.get('metadata') != file_metadata:
+        return None
+    return session
+
+
+def _remove_session(session_path):
+    try:
+        os.remove(session_path)
+    except OSError:
+        pass
+
+
+def _upload_one(path, file_metadata, chunk_size, session_dir):
+    """Uploads one file in resumable chunks, persisting the session."""
+    stat = os.stat(path)
+    mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    session_path = _session_path(session_dir, path)
+    service = service_cache.get_service('drive', 'v3')
+    for _ in range(2):
+        media = MediaFileUpload(path, mimetype=mimetype, chunksize=chunk_size,
+                                resumable=True)
+        # pylint: disable=maybe-no-member
+        request = service.files().create(body=file_metadata,
+                                          media_body=media, fields='id')
+        session = _load_session(session_path, stat, file_metadata)
+        if session:
+            request.resumable_uri = session['uri']
+            request.resumable_progress = session['progress']
+        try:
+            response = None
+            while response is None:
+                status, response = request.next_chunk()
+                if status:
+                    json_state.save_json(session_path, {
+                        'uri': request.resumable_uri,
+                        'progress': status.resumable_progress,
+                        'size': stat.st_size,
+                        'mtime': stat.st_mtime,
+                        'metadata': file_metadata,
+                    })
+        except HttpError as error:
+            # An expired session can not be resumed, start a new one.
+            if session and error.resp.status in (404, 410):
+                _remove_session(session_path)
+                continue
+            raise
+        _remove_session(session_path)
+        return response.get('id'), stat.st_size
+    raise RuntimeError(F'Could not resume upload of {path}')
+
+
+def upload_directory(real_folder_id, local_dir, conversions=None,
+                     chunk_size=CHUNK_SIZE, max_workers=MAX_WORKERS,
+                     session_dir=SESSION_DIR, deduplicate=False,
+                     link_duplicates=False):
+    """Upload every file of a local directory to a folder, in parallel.
+    Args:
+        real_folder_id: ID of the destination folder
+        local_dir: Local directory whose files are uploaded
+        conversions: Optional dict mapping a local mimetype to the Google
+            mimeType to convert to, e.g.
+            {'text/csv': 'application/vnd.google-apps.spreadsheet'}
+        chunk_size: Bytes per resumable chunk, a multiple of 256 KB
+        max_workers: Number of files uploaded concurrently
+        session_dir: Directory where resumable sessions are persisted so
+            that an interrupted run resumes each file where it stopped
+        deduplicate: Skip files whose MD5 matches a file of the same name
+            in the destination folder
+        link_duplicates: With deduplicate, create a shortcut instead of
+            uploading when the content exists under another name, unless
+            a shortcut of that name already points at it
+    Returns : Dict mapping local paths to file IDs (None on failure) and
+        the aggregate UploadStats.
+
+    Files converted to Google formats have no MD5 in Drive, so they are
+    never deduplicated and are uploaded again on every run.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    conversions = conversions or {}
+    os.makedirs(session_dir, exist_ok=True)
+    file_ids = {}
+    latencies = []
+    total_bytes = 0
+    skipped_bytes = 0
+    skipped = 0
+    started = time.time()
+    checksums, shortcuts = {}, {}
+    if deduplicate:
+        # One listing of the destination, shared by all workers.
+        checksums, shortcuts = _list_checksums(
+            service_cache.get_service('drive', 'v3'), real_folder_id)
+
+    def find_duplicate(path):
+        matches = checksums.get(file_md5(path))
+        if not matches:
+            return None
+        name = os.path.basename(path)
+        for match_name, file_id in matches:
+            if match_name == name:
+                return file_id
+        if not link_duplicates:
+            return None
+        for _, file_id in matches:
+            if file_id in shortcuts.get(name, {}):
+                return shortcuts[name][file_id]
+        file_metadata = {
+            'name': name,
+            'mimeType': SHORTCUT_MIME_TYPE,
+            'parents': [real_folder_id],
+            'shortcutDetails': {'targetId': matches[0][1]}
+        }
+        service = service_cache.get_service('drive', 'v3')
+        # pylint: disable=maybe-no-member
+        return service.files().create(body=file_metadata,
+                                      fields='id').execute().get('id')
+
+    def upload(path):
+        target_mimetype = conversions.get(mimetypes.guess_type(path)[0])
+        # Converted files can not match a checksum, skip hashing them.
+        if checksums and not target_mimetype:
+            file_id = find_duplicate(path)
+            if file_id:
+                return file_id, os.path.getsize(path), 0.0, True
+        file_metadata = {
+            'name': os.path.basename(path),
+            'parents': [real_folder_id]
+        }
+        if target_mimetype:
+            file_metadata['mimeType'] = target_mimetype
+        upload_started = time.time()
+        file_id, size = _upload_one(path, file_metadata, chunk_size,
+                                    session_dir)
+        return file_id, size, time.time() - upload_started, False
+
+    paths = sorted(entry.path for entry in os.scandir(local_dir)
+                   if entry.is_file())
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = {executor.submit(upload, path): path for path in paths}
+        for future in concurrent.futures.as_completed(futures):
+            path = futures[future]
+            try:
+                file_id, size, latency, duplicate = future.result()
+            except (HttpError, OSError, RuntimeError) as error:
+                print(F'An error occurred uploading {path}: {error}')
+                file_ids[path] = None
+                continue
+            print(F'File ID: {file_id} ({path})')
+            file_ids[path] = file_id
+            if duplicate:
+                skipped += 1
+                skipped_bytes += size
+            else:
+                latencies.append(latency)
+                total_bytes += size
+
+    seconds = time.time() - started
+    stats = UploadStats(
+        files=len(latencies),
+        skipped=skipped,
+        failed=len(paths) - len(latencies) - skipped,
+        bytes=total_bytes,
+        bytes_skipped=skipped_bytes,
+        seconds=seconds,
+        bytes_per_second=total_bytes / seconds if seconds else 0.0,
+        mean_latency=sum(latencies) / len(latencies) if latencies else 0.0,
+        max_latency=max(latencies, default=0.0))
+    print(F'Uploaded {stats.files} files ({stats.bytes} bytes) in '
+          F'{stats.seconds:.1f}s, {stats.bytes_per_second / 2 ** 20:.2f} '
+          F'MiB/s, {stats.skipped} unchanged, {stats.failed} failed.')
+    return file_ids, stats
+
+
+if __name__ == '__main__':
+    upload_directory(real_folder_id='1s0oKEZZXjImNngxHGnY0xed6Mw-tvspu',
+                     local_dir='reports',
+                     conversions={
+                         'text/csv': 'application/vnd.google-apps.spreadsheet'
+                     })
+# [END drive_upload_directory]
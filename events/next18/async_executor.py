@@ -0,0 +1,136 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# python3
+"""Executes discovery client requests on asyncio.
+
+Requests are built as usual with a service object, then awaited instead of
+executed. They are sent over one pool of keep-alive connections, so hundreds
+of requests can be in flight from a single thread.
+"""
+
+import asyncio
+import random
+
+import aiohttp
+import google_auth_httplib2
+import httplib2
+from googleapiclient.http import MAX_URI_LENGTH
+
+# Maximum number of connections kept open, and so of requests in flight.
+CONNECTION_LIMIT = 100
+KEEPALIVE_TIMEOUT = 30
+MAX_RETRIES = 5
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+class AsyncExecutor(object):
+    """Awaits HttpRequests built by the discovery client.
+
+    Use as an async context manager, which owns the connection pool:
+
+        async with AsyncExecutor(creds) as executor:
+            files = await executor.Execute(drive_service.files().list())
+    """
+
+    def __init__(self, credentials, limit=CONNECTION_LIMIT,
+                 keepalive_timeout=KEEPALIVE_TIMEOUT,
+                 max_retries=MAX_RETRIES):
+        self._credentials = credentials
+        self._limit = limit
+        self._keepalive_timeout = keepalive_timeout
+        self._max_retries = max_retries
+        self._session = None
+        self._refresh_lock = None
+
+    async def __aenter__(self):
+        # Created here so the lock belongs to the loop running the executor.
+        self._refresh_lock = asyncio.Lock()
+        connector = aiohttp.TCPConnector(
+            limit=self._limit, keepalive_timeout=self._keepalive_timeout)
+        self._session = aiohttp.ClientSession(connector=connector)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+        self._session = None
+
+    def _Expired(self):
+        # oauth2client and google-auth credentials report expiry differently.
+        if hasattr(self._credentials, 'access_token_expired'):
+            return (self._credentials.access_token is None or
+                    self._credentials.access_token_expired)
+        return not self._credentials.valid
+
+    def _Refresh(self):
+        if hasattr(self._credentials, 'access_token_expired'):
+            self._credentials.refresh(httplib2.Http())
+        else:
+            self._credentials.refresh(
+                google_auth_httplib2.Request(httplib2.Http()))
+
+    async def _Authorize(self, headers):
+        async with self._refresh_lock:
+            if self._Expired():
+                # Refreshing is rare and blocking, keep it off the loop.
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._Refresh)
+        self._credentials.apply(headers)
+
+    def _Retryable(self, status, content):
+        if status == 403:
+            return b'ratelimitexceeded' in content.lower()
+        return status in RETRYABLE_STATUSES
+
+    async def Execute(self, request):
+        """Sends a request and returns its deserialized response.
+
+        Rate limit, transient and connection errors are retried with
+        exponential backoff and jitter. Raises
+        googleapiclient.errors.HttpError for other non-2xx responses, like
+        HttpRequest.execute. Resumable media requests are not supported.
+        """
+        if request.resumable:
+            raise ValueError('Resumable requests can not be awaited')
+        method, uri, body = request.method, request.uri, request.body
+        headers = dict(request.headers)
+        # Mirror HttpRequest.execute for URIs too long for a GET.
+        if len(uri) > MAX_URI_LENGTH and method == 'GET':
+            method = 'POST'
+            headers['x-http-method-override'] = 'GET'
+            headers['content-type'] = 'application/x-www-form-urlencoded'
+            uri, body = uri.split('?', 1)
+        for attempt in range(self._max_retries + 1):
+            await self._Authorize(headers)
+            try:
+                async with self._session.request(
+                        method, uri, data=body, headers=headers) as response:
+                    content = await response.read()
+                    info = {key.lower(): value
+                            for key, value in response.headers.items()}
+                    info['status'] = str(response.status)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self._max_retries:
+                    raise
+            else:
+                if attempt == self._max_retries or \
+                        not self._Retryable(response.status, content):
+                    break
+            await asyncio.sleep(min(2 ** attempt, 64) + random.random())
+        return request.postproc(httplib2.Response(info), content)
+
+    async def Gather(self, requests):
+        """Executes requests concurrently, returning responses in order."""
+        return await asyncio.gather(
+            *(self.Execute(request) for request in requests))
@@ -21,6 +21,13 @@ title.
 """
 import re
 
+_TEXT_FIELDS = 'text/textElements/textRun/content'
+# Only the title and the text runs of shapes and tables are read, so fetch
+# nothing else from the (possibly large) presentation.
+PRESENTATION_FIELDS = (
+    'title,slides/pageElements(shape/{0},table/tableRows/tableCells/{0})'
+    .format(_TEXT_FIELDS))
+
 
 class PresentationReader(object):
 
@@ -32,7 +39,8 @@ class PresentationReader(object):
     def _InitPresentation(self):
         if not self._presentation:
             self._presentation = self._slides_service.presentations().get(
-                presentationId=self._presentation_id).execute()
+                presentationId=self._presentation_id,
+                fields=PRESENTATION_FIELDS).execute()
 
     def GetTitle(self):
         self._InitPresentation()
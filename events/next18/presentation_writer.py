@@ -53,8 +53,12 @@ class PresentationWriter(object):
         }
         self._requests.append(request)
 
-    def ExecuteBatchUpdate(self):
+    def BuildBatchUpdate(self):
+        """Returns the batchUpdate request of the pending writes, unsent."""
         body = {'requests': self._requests}
         self._requests = []
-        self._slides_service.presentations().batchUpdate(
-            presentationId=self._presentation_id, body=body).execute()
+        return self._slides_service.presentations().batchUpdate(
+            presentationId=self._presentation_id, body=body)
+
+    def ExecuteBatchUpdate(self):
+        self.BuildBatchUpdate().execute()
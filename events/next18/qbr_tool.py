@@ -23,8 +23,10 @@ pushes the data to Google Slides
 from __future__ import print_function
 
 import argparse
+import asyncio
 import re
 
+import async_executor
 import customer_data_service
 import customer_spreadsheet_reader
 import presentation_reader
@@ -37,6 +39,8 @@ from oauth2client import file as oauth_file
 from oauth2client import tools
 
 SCOPES = ['https://www.googleapis.com/auth/drive']
+# Customers whose presentations are generated at the same time.
+MAX_CONCURRENT_CUSTOMERS = 10
 store = oauth_file.Storage('token.json')
 creds = store.get()
 if not creds or creds.invalid:
@@ -155,29 +159,59 @@ def create_presentations(spreadsheet_id, customer_ids):
         slides_service, template_id)
     title = pres_reader.GetTitle()
 
-    # Generate a presentation for each customer
-    for customer_id in customer_ids:
-        # Create a copy of the presentation
-        new_title = customer_id + ' - ' + title
-        presentation_id = drive_service.files().copy(
-            fileId=template_id, body={
-                'name': new_title
-            }).execute().get('id')
-
-        # Replace the placeholders with the customer data in the copy
-        data = customer_spreadsheet.GetColumnData(customer_id)
-        data_dict = dict(zip(placeholders, data))
-        writer = presentation_writer.PresentationWriter(slides_service,
-                                                        presentation_id)
-        for placeholder, value in data_dict.items():
-            if re.findall(r'{(\w+).image}', placeholder):
-                writer.ReplaceAllShapesWithImage(placeholder, value)
-            else:
-                writer.ReplaceAllText(placeholder, value)
-            writer.ExecuteBatchUpdate()
-
-        print(customer_id +
-              ': https://docs.google.com/presentation/d/' + presentation_id)
+    # Generate the presentations for all customers concurrently
+    errors = asyncio.run(_create_presentations(
+        customer_spreadsheet, customer_ids, template_id, title, placeholders))
+    for customer_id, error in errors.items():
+        print(customer_id + ': failed: ' + str(error))
+
+
+async def _create_presentations(customer_spreadsheet, customer_ids,
+                                template_id, title, placeholders):
+    """Returns a dict of the customers that failed to their error."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CUSTOMERS)
+    async with async_executor.AsyncExecutor(creds) as executor:
+        results = await asyncio.gather(*(
+            _create_presentation(semaphore, executor, customer_spreadsheet,
+                                 customer_id, template_id, title,
+                                 placeholders)
+            for customer_id in customer_ids), return_exceptions=True)
+    return {customer_id: result
+            for customer_id, result in zip(customer_ids, results)
+            if isinstance(result, Exception)}
+
+
+async def _create_presentation(semaphore, executor, customer_spreadsheet,
+                               customer_id, template_id, title, placeholders):
+    async with semaphore:
+        await _fill_presentation(executor, customer_spreadsheet, customer_id,
+                                 template_id, title, placeholders)
+
+
+async def _fill_presentation(executor, customer_spreadsheet, customer_id,
+                             template_id, title, placeholders):
+    # Create a copy of the presentation
+    new_title = customer_id + ' - ' + title
+    presentation = await executor.Execute(drive_service.files().copy(
+        fileId=template_id, body={
+            'name': new_title
+        }))
+    presentation_id = presentation.get('id')
+
+    # Replace the placeholders with the customer data in the copy
+    data = customer_spreadsheet.GetColumnData(customer_id)
+    data_dict = dict(zip(placeholders, data))
+    writer = presentation_writer.PresentationWriter(slides_service,
+                                                    presentation_id)
+    for placeholder, value in data_dict.items():
+        if re.findall(r'{(\w+).image}', placeholder):
+            writer.ReplaceAllShapesWithImage(placeholder, value)
+        else:
+            writer.ReplaceAllText(placeholder, value)
+    await executor.Execute(writer.BuildBatchUpdate())
+
+    print(customer_id +
+          ': https://docs.google.com/presentation/d/' + presentation_id)
 
 
 if __name__ == '__main__':
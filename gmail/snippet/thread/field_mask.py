@@ -0,0 +1,118 @@
+"""Copyright 2022 Google LLC
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+# [START gmail_field_mask]
+
+from __future__ import print_function
+
+import re
+
+
+def build_fields(paths):
+    """Builds the minimal partial response mask for the fields read.
+    Args:
+        paths: Iterable of field paths such as 'messages/payload/headers'
+            or 'messages.payload.headers'
+    Returns: Mask for the `fields` parameter, e.g. 'messages/payload/headers'
+    """
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in re.split(r'[./]', path):
+            if name:
+                node = node.setdefault(name, {})
+    return _render(tree)
+
+
+def _render(tree):
+    parts = []
+    for name in sorted(tree):
+        children = tree[name]
+        if not children:
+            parts.append(name)
+        elif len(children) == 1:
+            parts.append(F'{name}/{_render(children)}')
+        else:
+            parts.append(F'{name}({_render(children)})')
+    return ','.join(parts)
+
+
+class FieldRecorder(object):
+    """Records which fields of a response are read.
+
+    Wrap a response, run the code that consumes it, then use fields() as
+    the `fields` mask of the request.
+    """
+
+    def __init__(self):
+        self._paths = set()
+
+    def wrap(self, value, path=()):
+        if isinstance(value, dict):
+            return _TrackedDict(self, path, value)
+        if isinstance(value, list):
+            return _TrackedList(self, path, value)
+        return value
+
+    def record(self, path):
+        self._paths.add(path)
+
+    def fields(self):
+        return build_fields('/'.join(path) for path in self._paths)
+
+
+class _TrackedDict(dict):
+
+    def __init__(self, recorder, path, value):
+        super(_TrackedDict, self).__init__(value)
+        self._recorder = recorder
+        self._path = path
+
+    def __getitem__(self, key):
+        path = self._path + (key,)
+        self._recorder.record(path)
+        return self._recorder.wrap(dict.__getitem__(self, key), path)
+
+    def get(self, key, default=None):
+        if key not in self:
+            # Record misses too, the field may be set on other resources.
+            self._recorder.record(self._path + (key,))
+            return default
+        return self[key]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+
+class _TrackedList(list):
+
+    def __init__(self, recorder, path, value):
+        super(_TrackedList, self).__init__(value)
+        self._recorder = recorder
+        self._path = path
+
+    def __getitem__(self, index):
+        value = list.__getitem__(self, index)
+        if isinstance(index, slice):
+            return _TrackedList(self._recorder, self._path, value)
+        return self._recorder.wrap(value, self._path)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+if __name__ == '__main__':
+    print(build_fields(['messages.payload.headers', 'messages.id']))
+# [END gmail_field_mask]
@@ -0,0 +1,47 @@
+"""Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+
+from field_mask import FieldRecorder, build_fields
+
+
+class TestFieldMask(unittest.TestCase):
+    """unit test class for snippets"""
+
+    def test_build_fields(self):
+        """to test building a fields mask"""
+        self.assertEqual(build_fields(['messages.payload.headers']),
+                         'messages/payload/headers')
+        self.assertEqual(build_fields(['title', 'slides/objectId',
+                                       'slides/pageElements']),
+                         'slides(objectId,pageElements),title')
+
+    def test_field_recorder(self):
+        """to test recording the fields read"""
+        recorder = FieldRecorder()
+        response = recorder.wrap({
+            'id': '1',
+            'snippet': 'unused',
+            'messages': [{'payload': {'headers': [], 'body': {}}}],
+        })
+        for message in response['messages']:
+            message['payload']['headers'].append({})
+        response.get('historyId')
+        self.assertEqual(recorder.fields(),
+                         'historyId,messages/payload/headers')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,7 +14,7 @@ limitations under the License.
 """
 import unittest
 
-from threads import show_chatty_threads
+from threads import profile_chatty_threads, show_chatty_threads
 
 
 class TestThreads(unittest.TestCase):
@@ -26,6 +26,12 @@ class TestThreads(unittest.TestCase):
         result = show_chatty_threads()
         cls.assertIsNotNone(cls, result)
 
+    @classmethod
+    def test_profile_chatty_threads(cls):
+        """to test profiling the fields of chatty threads"""
+        result = profile_chatty_threads()
+        cls.assertIsNotNone(cls, result)
+
 
 if __name__ == '__main__':
     unittest.main()
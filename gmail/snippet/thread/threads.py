@@ -13,10 +13,29 @@ limitations under the License.
 
 from __future__ import print_function
 
+import field_mask
 import google.auth
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+# Fields read from users.threads.list and from each users.threads.get.
+LIST_FIELDS = field_mask.build_fields(['threads.id'])
+THREAD_FIELDS = field_mask.build_fields(['messages.payload.headers'])
+
+
+def _chatty_subject(tdata):
+    """Returns the Subject of a thread with more than two messages, or an
+    empty string."""
+    nmsgs = len(tdata['messages'])
+
+    # skip if <3 msgs in thread
+    if nmsgs > 2:
+        msg = tdata['messages'][0]['payload']
+        for header in msg['headers']:
+            if header['name'] == 'Subject':
+                return header['value']
+    return ''
+
 
 def show_chatty_threads():
     """Display threads with long conversations(>= 3 messages)
@@ -34,27 +53,54 @@ def show_chatty_threads():
 
         # pylint: disable=maybe-no-member
         # pylint: disable:R1710
-        threads = service.users().threads().list(userId='me').execute().get('threads', [])
+        threads = service.users().threads().list(
+            userId='me', fields=LIST_FIELDS).execute().get('threads', [])
         for thread in threads:
-            tdata = service.users().threads().get(userId='me', id=thread['id']).execute()
-            nmsgs = len(tdata['messages'])
-
-            # skip if <3 msgs in thread
-            if nmsgs > 2:
-                msg = tdata['messages'][0]['payload']
-                subject = ''
-                for header in msg['headers']:
-                    if header['name'] == 'Subject':
-                        subject = header['value']
-                        break
-                if subject:  # skip if no Subject line
-                    print(F'- {subject}, {nmsgs}')
+            tdata = service.users().threads().get(
+                userId='me', id=thread['id'], format='metadata',
+                metadataHeaders=['Subject'], fields=THREAD_FIELDS).execute()
+            subject = _chatty_subject(tdata)
+            if subject:  # skip if no Subject line
+                print(F'- {subject}, {len(tdata["messages"])}')
         return threads
 
     except HttpError as error:
         print(F'An error occurred: {error}')
 
 
+
+def profile_chatty_threads():
+    """Reports the fields show_chatty_threads reads from a thread.
+    Return: Minimal fields mask for users.threads.get, to compare with
+        THREAD_FIELDS
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    creds, _ = google.auth.default()
+
+    try:
+        # create gmail api client
+        service = build('gmail', 'v1', credentials=creds)
+
+        # pylint: disable=maybe-no-member
+        threads = service.users().threads().list(
+            userId='me', fields=LIST_FIELDS).execute().get('threads', [])
+        recorder = field_mask.FieldRecorder()
+        for thread in threads:
+            # Fetch whole threads, so any field read is recorded.
+            _chatty_subject(recorder.wrap(service.users().threads().get(
+                userId='me', id=thread['id']).execute()))
+        fields = recorder.fields()
+        print(F'Fields read: {fields}')
+        return fields
+
+    except HttpError as error:
+        print(F'An error occurred: {error}')
+        return None
+
+
 if __name__ == '__main__':
     show_chatty_threads()
 # [END gmail_show_chatty_threads]
@@ -0,0 +1,186 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# [START sheets_append_sink]
+from __future__ import print_function
+
+import collections
+import queue
+import random
+import threading
+import time
+
+import google.auth
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+CAPACITY = 10000
+FLUSH_ROWS = 500
+FLUSH_INTERVAL = 5.0
+MAX_RETRIES = 5
+# values().append is not idempotent, so only failures where the rows were
+# certainly not written are retried.
+RETRYABLE_STATUSES = (429,)
+
+
+class AppendSink(object):
+    """
+    Buffers rows in memory and appends them to a sheet in the background.
+    Rows are flushed once FLUSH_ROWS are buffered or FLUSH_INTERVAL seconds
+    have passed, each flush sending every buffered row in one
+    values().append. append() blocks while the buffer is full, so producers
+    slow down to the rate the sheet accepts instead of exhausting memory.
+    A flush is only retried when it was rejected by rate limiting or its
+    connection was refused. Other failures, such as timeouts or 5xx
+    replies where the rows may already be written, drop the batch rather
+    than risk appending it twice, so delivery is at-most-once.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+
+    def __init__(self, spreadsheet_id, range_name, value_input_option='RAW',
+                 capacity=CAPACITY, flush_rows=FLUSH_ROWS,
+                 flush_interval=FLUSH_INTERVAL, max_retries=MAX_RETRIES):
+        self.spreadsheet_id = spreadsheet_id
+        self.range_name = range_name
+        self.value_input_option = value_input_option
+        self.capacity = capacity
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.appended = 0
+        self.dropped = 0
+        self.flushes = 0
+        self._rows = collections.deque()
+        self._enqueued = 0
+        self._done = 0
+        self._flush_target = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._creds, _ = google.auth.default()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def append(self, row, timeout=None):
+        """Buffers a row, blocking while the buffer is full.
+        Raises queue.Full if no space frees up within timeout seconds."""
+        with self._condition:
+            if self._closed:
+                raise ValueError('append to a closed sink')
+            if not self._condition.wait_for(
+                    lambda: len(self._rows) < self.capacity, timeout):
+                raise queue.Full
+            self._rows.append(row)
+            self._enqueued += 1
+            if len(self._rows) >= self.flush_rows:
+                self._condition.notify_all()
+
+    def flush(self):
+        """Blocks until every row appended so far is written or dropped."""
+        with self._condition:
+            target = self._enqueued
+            self._flush_target = max(self._flush_target, target)
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: self._done >= target)
+
+    def close(self):
+        """Flushes the remaining rows and stops the background thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _next_batch(self):
+        with self._condition:
+            self._condition.wait_for(
+                lambda: (self._closed or len(self._rows) >= self.flush_rows or
+                         (self._rows and self._flush_target > self._done)),
+                self.flush_interval)
+            rows = list(self._rows)
+            self._rows.clear()
+            self._condition.notify_all()
+            return rows
+
+    def _write(self, service, rows):
+        body = {
+            'values': rows
+        }
+        for attempt in range(self.max_retries + 1):
+            try:
+                # pylint: disable=maybe-no-member
+                service.spreadsheets().values().append(
+                    spreadsheetId=self.spreadsheet_id, range=self.range_name,
+                    valueInputOption=self.value_input_option,
+                    insertDataOption='INSERT_ROWS', body=body).execute()
+                return
+            except HttpError as error:
+                if error.resp.status not in RETRYABLE_STATUSES or \
+                        attempt == self.max_retries:
+                    raise
+            except ConnectionRefusedError:
+                # The request never reached the server.
+                if attempt == self.max_retries:
+                    raise
+            time.sleep(min(2 ** attempt, 64) + random.random())
+
+    def _run(self):
+        service = None
+        while True:
+            rows = self._next_batch()
+            if rows:
+                written = False
+                # Any failure drops the batch rather than the thread, so
+                # flush() and append() never wait on a dead flusher.
+                # pylint: disable=broad-except
+                try:
+                    if service is None:
+                        # httplib2 is not thread-safe, the flush thread
+                        # owns its client.
+                        service = build('sheets', 'v4',
+                                        credentials=self._creds)
+                    self._write(service, rows)
+                    written = True
+                except Exception as error:
+                    print(f"An error occurred: {error}")
+                with self._condition:
+                    if written:
+                        self.appended += len(rows)
+                        self.flushes += 1
+                    else:
+                        self.dropped += len(rows)
+                    self._done += len(rows)
+                    self._condition.notify_all()
+            with self._condition:
+                if self._closed and not self._rows:
+                    return
+
+
+if __name__ == '__main__':
+    # Pass: spreadsheet_id, and range_name
+    with AppendSink("1CM29gwKIzeXsAppeNwrc8lbYaVMmUclprLuLYuHog4k",
+                    "Sheet1") as sink:
+        for index in range(2000):
+            sink.append([time.time(), f"event {index}"])
+    print(f"{sink.appended} rows appended in {sink.flushes} requests.")
+    # [END sheets_append_sink]
@@ -0,0 +1,198 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# [START sheets_batch_update_builder]
+from __future__ import print_function
+
+import copy
+import json
+import random
+
+import google.auth
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+# Keep each batchUpdate payload well under the Sheets request size limit.
+MAX_PAYLOAD_BYTES = 2 * 1024 * 1024
+# Requests that only set state, so a repeat right after an identical one
+# changes nothing and can be dropped.
+IDEMPOTENT_REQUESTS = ('repeatCell', 'updateBorders', 'updateCells',
+                       'updateDimensionProperties', 'updateSheetProperties',
+                       'updateSpreadsheetProperties')
+
+
+def _merge(previous, request):
+    """Returns one request equivalent to two adjacent ones, or None.
+    Joined updateCells rows are added to previous in place."""
+    kind = next(iter(request))
+    if kind != next(iter(previous)):
+        return None
+    if previous == request and kind in IDEMPOTENT_REQUESTS:
+        return previous
+    first, second = previous[kind], request[kind]
+    if kind == 'repeatCell' and first.get('range') == second.get('range') \
+            and first.get('fields') == second.get('fields'):
+        # The later request overwrites exactly what the earlier one set.
+        return request
+    if kind == 'updateCells' and 'start' in first and 'start' in second \
+            and first.get('fields') == second.get('fields'):
+        rows = first.get('rows', [])
+        start, next_start = first['start'], second['start']
+        if start.get('sheetId') == next_start.get('sheetId') and \
+                start.get('columnIndex', 0) == \
+                next_start.get('columnIndex', 0) and \
+                start.get('rowIndex', 0) + \
+                (len(rows) if isinstance(rows, list) else 1) == \
+                next_start.get('rowIndex', 0):
+            if not isinstance(rows, list):
+                first['rows'] = rows = [rows]
+            more_rows = second.get('rows', [])
+            if isinstance(more_rows, list):
+                rows.extend(more_rows)
+            else:
+                rows.append(more_rows)
+            return previous
+    return None
+
+
+class BatchUpdateBuilder(object):
+    """
+    Queues spreadsheets().batchUpdate requests from many call sites and
+    sends them in as few round-trips as the payload limit allows.
+    Adjacent compatible requests are merged, and IDs of new sheets and
+    filter views are chosen client-side, so later requests can refer to
+    them in the same batch. A single batchUpdate is applied atomically;
+    when the queue spans several, each is applied in order on its own.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+
+    def __init__(self, spreadsheet_id, service=None,
+                 max_payload_bytes=MAX_PAYLOAD_BYTES):
+        self.spreadsheet_id = spreadsheet_id
+        self.max_payload_bytes = max_payload_bytes
+        self.round_trips = 0
+        if service is None:
+            creds, _ = google.auth.default()
+            service = build('sheets', 'v4', credentials=creds)
+        self._service = service
+        self._requests = []
+        # Serialized size of each queued request.
+        self._sizes = []
+        # Position of each added request within self._requests.
+        self._slots = []
+        self._ids = set()
+
+    def new_id(self):
+        """Returns an ID for a new sheet or filter view of this batch."""
+        while True:
+            new_id = random.randint(1, 2 ** 31 - 1)
+            if new_id not in self._ids:
+                self._ids.add(new_id)
+                return new_id
+
+    def add(self, request):
+        """Queues a request, e.g. {'repeatCell': {...}}.
+        Returns the index of its reply in the list flush() returns."""
+        request = copy.deepcopy(request)
+        size = len(json.dumps(request))
+        merged = None
+        # A merged request can not be split again, so stop growing it once
+        # it would exceed the payload budget.
+        if self._requests and \
+                self._sizes[-1] + size <= self.max_payload_bytes:
+            merged = _merge(self._requests[-1], request)
+        if merged is request:
+            self._requests[-1] = request
+            self._sizes[-1] = size
+        elif merged is not None:
+            # Joined rows, or a dropped duplicate which is over-counted.
+            self._sizes[-1] += len(json.dumps(
+                request.get('updateCells', {}).get('rows', []))) + 2
+        else:
+            self._requests.append(request)
+            self._sizes.append(size)
+        self._slots.append(len(self._requests) - 1)
+        return len(self._slots) - 1
+
+    def add_sheet(self, properties=None):
+        """Queues an addSheet request and returns the new sheet's ID."""
+        properties = dict(properties or {})
+        properties.setdefault('sheetId', self.new_id())
+        self.add({'addSheet': {'properties': properties}})
+        return properties['sheetId']
+
+    def add_filter_view(self, filter_view):
+        """Queues an addFilterView request and returns the new view's ID."""
+        filter_view = dict(filter_view)
+        filter_view.setdefault('filterViewId', self.new_id())
+        self.add({'addFilterView': {'filter': filter_view}})
+        return filter_view['filterViewId']
+
+    def _batches(self):
+        batch, size = [], 0
+        for request, request_size in zip(self._requests, self._sizes):
+            if batch and size + request_size > self.max_payload_bytes:
+                yield batch
+                batch, size = [], 0
+            batch.append(request)
+            size += request_size
+        if batch:
+            yield batch
+
+    def flush(self):
+        """Sends the queued requests.
+        Returns: List with the reply of each added request, in add order.
+        Requests merged into one share its reply."""
+        replies = []
+        try:
+            for batch in self._batches():
+                # pylint: disable=maybe-no-member
+                response = self._service.spreadsheets().batchUpdate(
+                    spreadsheetId=self.spreadsheet_id,
+                    body={'requests': batch}).execute()
+                self.round_trips += 1
+                replies.extend(response.get('replies', [{}] * len(batch)))
+        finally:
+            slots = self._slots
+            self._requests, self._sizes, self._slots = [], [], []
+        return [replies[slot] if slot < len(replies) else None
+                for slot in slots]
+
+
+if __name__ == '__main__':
+    # Pass: spreadsheet_id
+    try:
+        builder = BatchUpdateBuilder(
+            "1CM29gwKIzeXsAppeNwrc8lbYaVMmUclprLuLYuHog4k")
+        sheet_id = builder.add_sheet({'title': 'Report'})
+        for row_index in range(10):
+            builder.add({
+                'updateCells': {
+                    'rows': {'values': [{'userEnteredValue': {
+                        'numberValue': row_index}}]},
+                    'start': {'sheetId': sheet_id, 'rowIndex': row_index,
+                              'columnIndex': 0},
+                    'fields': 'userEnteredValue'
+                }
+            })
+        builder.flush()
+        print(f"{builder.round_trips} round-trips made.")
+    except HttpError as error:
+        print(f"An error occurred: {error}")
+    # [END sheets_batch_update_builder]
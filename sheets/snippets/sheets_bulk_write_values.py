@@ -0,0 +1,175 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# [START sheets_bulk_write_values]
+from __future__ import print_function
+
+import concurrent.futures
+import datetime
+import math
+import re
+import threading
+import time
+
+import google.auth
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+# Cells sent per request, keeping each payload well under the 2 MB the
+# Sheets API recommends.
+CHUNK_CELLS = 50000
+MAX_WORKERS = 4
+
+
+def column_letters(index):
+    """Returns the A1 letters of a 1-based column index, e.g. 28 -> 'AB'."""
+    letters = ''
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def column_index(letters):
+    """Returns the 1-based index of A1 column letters, e.g. 'AB' -> 28."""
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index
+
+
+def quote_sheet_name(sheet_name):
+    return "'" + sheet_name.replace("'", "''") + "'"
+
+
+def _cell(value):
+    if hasattr(value, 'item'):
+        # NumPy scalar, e.g. numpy.float64.
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return ''
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def _chunks(columns, chunk_rows):
+    """Yields (first row offset, rows) serialising one chunk at a time."""
+    row_count = len(columns[0]) if columns else 0
+    for start in range(0, row_count, chunk_rows):
+        stop = min(start + chunk_rows, row_count)
+        yield start, [[_cell(value) for value in row]
+                      for row in zip(*(column[start:stop]
+                                       for column in columns))]
+
+
+def _write_chunk(creds, local, spreadsheet_id, range_name, rows,
+                 value_input_option):
+    if not hasattr(local, 'service'):
+        # httplib2 is not thread-safe, each worker gets its own client.
+        local.service = build('sheets', 'v4', credentials=creds)
+    body = {
+        'valueInputOption': value_input_option,
+        'data': [{'range': range_name, 'values': rows}]
+    }
+    # pylint: disable=maybe-no-member
+    result = local.service.spreadsheets().values().batchUpdate(
+        spreadsheetId=spreadsheet_id, body=body).execute()
+    return result.get('totalUpdatedCells', 0)
+
+
+def bulk_write_values(spreadsheet_id, sheet_name, columns, start_cell='A1',
+                      value_input_option='RAW', chunk_cells=CHUNK_CELLS,
+                      max_workers=MAX_WORKERS):
+    """
+    Writes columnar data in row chunks sent concurrently.
+    Args:
+        spreadsheet_id: ID of the spreadsheet to write to
+        sheet_name: Title of the sheet to write to
+        columns: Sequence of equal-length columns, e.g. NumPy arrays,
+            array.array buffers or lists
+        start_cell: Top-left cell of the written block
+        value_input_option: 'RAW' or 'USER_ENTERED'
+        chunk_cells: Maximum cells sent per request
+        max_workers: Number of requests in flight
+    Returns: Dict with totalUpdatedCells, totalUpdatedRows, seconds and
+        cellsPerSecond.
+
+    Rows are serialised one chunk at a time, and at most max_workers chunks
+    are held in memory, so memory is bounded by the chunk size rather than
+    by the size of the columns.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    columns = list(columns)
+    if len({len(column) for column in columns}) > 1:
+        raise ValueError('All columns must have the same length')
+    match = re.match(r'^([A-Za-z]+)(\d+)$', start_cell)
+    if not match:
+        raise ValueError(f"Invalid start cell: {start_cell}")
+    first_column = column_index(match.group(1))
+    first_row = int(match.group(2))
+    last_column = column_letters(first_column + len(columns) - 1)
+    chunk_rows = max(1, chunk_cells // max(1, len(columns)))
+
+    creds, _ = google.auth.default()
+    local = threading.local()
+    updated_cells = 0
+    start_time = time.monotonic()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            pending = set()
+            for start, rows in _chunks(columns, chunk_rows):
+                if len(pending) >= max_workers:
+                    done, pending = concurrent.futures.wait(
+                        pending,
+                        return_when=concurrent.futures.FIRST_COMPLETED)
+                    updated_cells += sum(future.result() for future in done)
+                top = first_row + start
+                range_name = (f"{quote_sheet_name(sheet_name)}!"
+                              f"{match.group(1).upper()}{top}:"
+                              f"{last_column}{top + len(rows) - 1}")
+                pending.add(executor.submit(
+                    _write_chunk, creds, local, spreadsheet_id, range_name,
+                    rows, value_input_option))
+            updated_cells += sum(future.result() for future in pending)
+    except HttpError as error:
+        print(f"An error occurred: {error}")
+        return error
+
+    seconds = time.monotonic() - start_time
+    result = {
+        'totalUpdatedCells': updated_cells,
+        'totalUpdatedRows': len(columns[0]) if columns else 0,
+        'seconds': seconds,
+        'cellsPerSecond': updated_cells / seconds if seconds else 0.0
+    }
+    print(f"{updated_cells} cells updated, "
+          f"{result['cellsPerSecond']:.0f} cells/second.")
+    return result
+
+
+if __name__ == '__main__':
+    # Pass: spreadsheet_id, sheet_name and columns
+    bulk_write_values("1CM29gwKIzeXsAppeNwrc8lbYaVMmUclprLuLYuHog4k",
+                      "Sheet1",
+                      [
+                          list(range(1000)),
+                          [value * 0.5 for value in range(1000)]
+                      ])
+    # [END sheets_bulk_write_values]
@@ -17,6 +17,8 @@ limitations under the License.
 # [START sheets_filter_views]
 from __future__ import print_function
 
+import random
+
 import google.auth
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -39,9 +41,13 @@ def filter_views(spreadsheet_id):
             'startRowIndex': 0,
             'startColumnIndex': 0,
         }
+        # Choosing the new filter view's ID client-side lets the same batch
+        # duplicate it.
+        filter_view_id = random.randrange(1, 2 ** 31)
         addfilterviewrequest = {
             'addFilterView': {
                 'filter': {
+                    'filterViewId': filter_view_id,
                     'title': 'Sample Filter',
                     'range': my_range,
                     'sortSpecs': [{
@@ -65,27 +71,21 @@ def filter_views(spreadsheet_id):
             }
         }
 
-        body = {'requests': [addfilterviewrequest]}
-        addfilterviewresponse = service.spreadsheets() \
-            .batchUpdate(spreadsheetId=spreadsheet_id, body=body).execute()
-
         duplicatefilterviewrequest = {
             'duplicateFilterView': {
-                'filterId':
-                    addfilterviewresponse['replies'][0]
-                    ['addFilterView']['filter']
-                    ['filterViewId']
+                'filterId': filter_view_id
             }
         }
 
-        body = {'requests': [duplicatefilterviewrequest]}
+        body = {'requests': [addfilterviewrequest,
+                             duplicatefilterviewrequest]}
         duplicatefilterviewresponse = service.spreadsheets() \
             .batchUpdate(spreadsheetId=spreadsheet_id, body=body).execute()
 
         updatefilterviewrequest = {
             'updateFilterView': {
                 'filter': {
-                    'filterViewId': duplicatefilterviewresponse['replies'][0]
+                    'filterViewId': duplicatefilterviewresponse['replies'][1]
                     ['duplicateFilterView']['filter']['filterViewId'],
                     'title': 'Updated Filter',
                     'criteria': {
@@ -17,6 +17,8 @@ limitations under the License.
 # [START sheets_pivot_tables]
 from __future__ import print_function
 
+import random
+
 import google.auth
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -33,21 +35,15 @@ def pivot_tables(spreadsheet_id):
     # pylint: disable=maybe-no-member
     try:
         service = build('sheets', 'v4', credentials=creds)
-        # Create two sheets for our pivot table.
-        body = {
-            'requests': [{
-                'addSheet': {}
-            }, {
-                'addSheet': {}
-            }]
-        }
-        batch_update_response = service.spreadsheets() \
-            .batchUpdate(spreadsheetId=spreadsheet_id, body=body).execute()
-        source_sheet_id = batch_update_response.get('replies')[0] \
-            .get('addSheet').get('properties').get('sheetId')
-        target_sheet_id = batch_update_response.get('replies')[1] \
-            .get('addSheet').get('properties').get('sheetId')
-        requests = []
+        # Create two sheets for our pivot table. Choosing their IDs
+        # client-side lets one batch create them and the pivot table.
+        source_sheet_id = random.randrange(1, 2 ** 31 - 1)
+        target_sheet_id = source_sheet_id + 1
+        requests = [{
+            'addSheet': {'properties': {'sheetId': source_sheet_id}}
+        }, {
+            'addSheet': {'properties': {'sheetId': target_sheet_id}}
+        }]
         requests.append({
             'updateCells': {
                 'rows': {
@@ -0,0 +1,180 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# [START sheets_snapshot_cache]
+from __future__ import print_function
+
+import collections
+import hashlib
+import json
+import os
+import threading
+
+import google.auth
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+MAX_ENTRIES = 128
+MAX_DISK_ENTRIES = 1024
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+class SnapshotCache(object):
+    """
+    Caches read responses of spreadsheets in memory and on disk.
+    Before a cached response is returned, the spreadsheet's Drive file
+    version is read with one small files().get. The version changes with
+    every edit, so a response is only reused while the spreadsheet is
+    unchanged. Least recently used entries are evicted past max_entries in
+    memory and max_disk_entries on disk.
+
+    Responses are only kept on disk when a cache_dir is given. They are
+    stored unencrypted, so the directory is created readable by its owner
+    only.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=MAX_ENTRIES,
+                 max_disk_entries=MAX_DISK_ENTRIES, drive_service=None):
+        if drive_service is None:
+            creds, _ = google.auth.default()
+            drive_service = build('drive', 'v3', credentials=creds)
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._drive_service = drive_service
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            # makedirs leaves an existing directory's mode unchanged.
+            os.chmod(cache_dir, 0o700)
+
+    def _version(self, spreadsheet_id):
+        # pylint: disable=maybe-no-member
+        spreadsheet_file = self._drive_service.files().get(
+            fileId=spreadsheet_id, fields='version',
+            supportsAllDrives=True).execute()
+        return spreadsheet_file.get('version')
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def _load(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), encoding='utf-8') as cache_file:
+                entry = json.load(cache_file)
+            # Mark the file as recently used for disk eviction.
+            os.utime(self._path(key))
+        except (OSError, ValueError):
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _store(self, key, entry):
+        self._remember(key, entry)
+        if not self.cache_dir:
+            return
+        tmp_path = self._path(key) + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(entry, cache_file)
+        os.replace(tmp_path, self._path(key))
+        paths = [os.path.join(self.cache_dir, name)
+                 for name in os.listdir(self.cache_dir)
+                 if name.endswith('.json')]
+        if len(paths) > self.max_disk_entries:
+            paths.sort(key=os.path.getmtime)
+            for path in paths[:len(paths) - self.max_disk_entries]:
+                os.remove(path)
+
+    def execute(self, request, spreadsheet_id):
+        """Returns the response of a read request of a spreadsheet,
+        e.g. values().get or spreadsheets().get, from the cache if the
+        spreadsheet did not change since it was cached."""
+        body = request.body or ''
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        key = hashlib.sha256(
+            f"{request.method} {request.uri}\n{body}".encode('utf-8')
+        ).hexdigest()
+        version = self._version(spreadsheet_id)
+        entry = self._load(key)
+        if entry is not None and entry.get('version') == version:
+            self.hits += 1
+            return entry.get('response')
+        self.misses += 1
+        response = request.execute()
+        self._store(key, {'version': version, 'response': response})
+        return response
+
+
+def _get_default_cache():
+    global _default_cache  # pylint: disable=global-statement
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SnapshotCache()
+        return _default_cache
+
+
+def get_values(spreadsheet_id, range_name, cache=None):
+    """
+    Gets values through the snapshot cache.
+    Without a cache, one in-memory cache shared by every call is used.
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+        """
+    creds, _ = google.auth.default()
+    # pylint: disable=maybe-no-member
+    try:
+        service = build('sheets', 'v4', credentials=creds)
+        cache = cache or _get_default_cache()
+
+        result = cache.execute(service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range=range_name), spreadsheet_id)
+        rows = result.get('values', [])
+        print(f"{len(rows)} rows retrieved")
+        return result
+    except HttpError as error:
+        print(f"An error occurred: {error}")
+        return error
+
+
+if __name__ == '__main__':
+    # Pass: spreadsheet_id, and range_name
+    get_values("1CM29gwKIzeXsAppeNwrc8lbYaVMmUclprLuLYuHog4k", "A1:C2")
+    # [END sheets_snapshot_cache]
@@ -0,0 +1,178 @@
+"""
+Copyright 2022 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# [START sheets_stream_values]
+from __future__ import print_function
+
+import collections
+import concurrent.futures
+import threading
+
+import google.auth
+import numpy
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from sheets_bulk_write_values import (column_index, column_letters,
+                                      quote_sheet_name)
+
+WINDOW_ROWS = 10000
+MAX_WORKERS = 4
+
+
+def _infer_dtype(values):
+    """Returns the dtype of a column from the values of its first window.
+
+    Numbers become float64 with NaN for empty cells. Anything else,
+    including columns that are still blank, is kept as an object array.
+    """
+    kinds = {type(value) for value in values if value != ''}
+    if kinds and kinds <= {int, float}:
+        return numpy.dtype(numpy.float64)
+    return numpy.dtype(object)
+
+
+def _to_array(values, length, dtype):
+    """Returns one column of a window as an array of dtype."""
+    values = values + [''] * (length - len(values))
+    if dtype.kind == 'f':
+        try:
+            return numpy.array([numpy.nan if value == '' else value
+                                for value in values], dtype=dtype)
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"Column is not numeric, pass its dtype in "
+                             f"dtypes: {error}") from error
+    if dtype.kind == 'O':
+        array = numpy.empty(length, dtype=object)
+        array[:] = values
+        return array
+    return numpy.array(values, dtype=dtype)
+
+
+def _read_window(creds, local, spreadsheet_id, range_name):
+    if not hasattr(local, 'service'):
+        # httplib2 is not thread-safe, each worker gets its own client.
+        local.service = build('sheets', 'v4', credentials=creds)
+    # pylint: disable=maybe-no-member
+    result = local.service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id, range=range_name,
+        majorDimension='COLUMNS', valueRenderOption='UNFORMATTED_VALUE',
+        dateTimeRenderOption='SERIAL_NUMBER').execute()
+    return result.get('values', [])
+
+
+def stream_values(spreadsheet_id, sheet_name, first_column='A',
+                  last_column='Z', start_row=1, end_row=None, names=None,
+                  dtypes=None, window_rows=WINDOW_ROWS,
+                  max_workers=MAX_WORKERS):
+    """
+    Reads a large range as record batches of row windows.
+    Args:
+        spreadsheet_id: ID of the spreadsheet to read
+        sheet_name: Title of the sheet to read
+        first_column: First column of the range, e.g. 'A'
+        last_column: Last column of the range, e.g. 'F'
+        start_row: First row of the range
+        end_row: Last row of the range, defaults to the last row of the sheet
+        names: Field names of the records, defaults to the column letters
+        dtypes: numpy dtype of each column, inferred from the first window
+            with values by default
+        window_rows: Rows fetched per request
+        max_workers: Number of windows fetched concurrently
+    Yields: A numpy.recarray per window, in row order.
+
+    Record i of the concatenated batches is sheet row start_row + i: blank
+    rows are returned as empty records, and only the blank rows after the
+    last row with values are left out. Every batch has the same dtypes. At
+    most max_workers + 1 windows are held in memory, whatever the size of
+    the range. Raises HttpError if a window can not be read, and ValueError
+    if a value does not fit its column's dtype.
+
+    Load pre-authorized user credentials from the environment.
+    TODO(developer) - See https://developers.google.com/identity
+    for guides on implementing OAuth2 for the application.
+    """
+    creds, _ = google.auth.default()
+    first_index = column_index(first_column)
+    width = column_index(last_column) - first_index + 1
+    names = names or [column_letters(first_index + offset)
+                      for offset in range(width)]
+    if end_row is None:
+        service = build('sheets', 'v4', credentials=creds)
+        # pylint: disable=maybe-no-member
+        spreadsheet = service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            ranges=[quote_sheet_name(sheet_name)],
+            fields='sheets/properties/gridProperties/rowCount').execute()
+        end_row = (spreadsheet['sheets'][0]['properties']['gridProperties']
+                   ['rowCount'])
+    windows = iter(range(start_row, end_row + 1, window_rows))
+    local = threading.local()
+
+    def submit(executor, pending):
+        top = next(windows, None)
+        if top is not None:
+            bottom = min(top + window_rows - 1, end_row)
+            range_name = (f"{quote_sheet_name(sheet_name)}!"
+                          f"{first_column}{top}:{last_column}{bottom}")
+            pending.append((bottom - top + 1, executor.submit(
+                _read_window, creds, local, spreadsheet_id, range_name)))
+
+    def to_records(columns, length):
+        return numpy.rec.fromarrays(
+            [_to_array(column, length, dtype)
+             for column, dtype in zip(columns, dtypes)], names=names)
+
+    if dtypes is not None:
+        dtypes = [numpy.dtype(dtype) for dtype in dtypes]
+    # Blank windows are only yielded once a later window has values, and
+    # the last window with values is trimmed when the range is exhausted.
+    blank_lengths = []
+    last = None
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        pending = collections.deque()
+        for _ in range(max_workers):
+            submit(executor, pending)
+        while pending:
+            length, future = pending.popleft()
+            columns = future.result()
+            submit(executor, pending)
+            if not columns:
+                blank_lengths.append(length)
+                continue
+            columns += [[]] * (width - len(columns))
+            if dtypes is None:
+                dtypes = [_infer_dtype(column) for column in columns]
+            if last is not None:
+                yield to_records(*last)
+            for blank_length in blank_lengths:
+                yield to_records([[]] * width, blank_length)
+            blank_lengths = []
+            last = (columns, length)
+    if last is not None:
+        columns = last[0]
+        yield to_records(columns, max(len(column) for column in columns))
+
+
+if __name__ == '__main__':
+    # Pass: spreadsheet_id, sheet_name and the columns to read
+    try:
+        for batch in stream_values(
+                "1CM29gwKIzeXsAppeNwrc8lbYaVMmUclprLuLYuHog4k", "Sheet1",
+                first_column='A', last_column='C'):
+            print(f"{len(batch)} rows read")
+    except HttpError as error:
+        print(f"An error occurred: {error}")
+    # [END sheets_stream_values]
@@ -0,0 +1,40 @@
+"""
+Copyright 2022 Google LLC
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+import sheets_append_sink
+from base_test import BaseTest
+
+
+class Testappendsink(BaseTest):
+    """Unit test for append sink Sheet snippet"""
+
+    def test_append_sink(self):
+        """coalesces buffered rows into few appends"""
+        spreadsheet_id = self.create_test_spreadsheet()
+        with sheets_append_sink.AppendSink(spreadsheet_id, 'Sheet1',
+                                           flush_rows=10) as sink:
+            for index in range(25):
+                sink.append([index, f'event {index}'])
+        self.assertEqual(25, sink.appended)
+        self.assertEqual(0, sink.dropped)
+        self.assertLessEqual(sink.flushes, 3)
+        result = self.service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range='Sheet1!A:B').execute()
+        self.assertEqual(25, len(result.get('values')))
+        self.assertEqual(['24', 'event 24'], result.get('values')[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
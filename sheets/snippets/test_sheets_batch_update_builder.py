@@ -0,0 +1,51 @@
+"""
+Copyright 2022 Google LLC
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+import sheets_batch_update_builder
+from base_test import BaseTest
+
+
+class Testbatchupdatebuilder(BaseTest):
+    """Unit test for batch update builder Sheet snippet"""
+
+    def test_batch_update_builder(self):
+        """coalesces dependent requests into one round-trip"""
+        spreadsheet_id = self.create_test_spreadsheet()
+        builder = sheets_batch_update_builder.BatchUpdateBuilder(
+            spreadsheet_id, service=self.service)
+        sheet_id = builder.add_sheet({'title': 'Report'})
+        for row_index in range(3):
+            builder.add({
+                'updateCells': {
+                    'rows': {'values': [{'userEnteredValue': {
+                        'stringValue': f'row {row_index}'}}]},
+                    'start': {'sheetId': sheet_id, 'rowIndex': row_index,
+                              'columnIndex': 0},
+                    'fields': 'userEnteredValue'
+                }
+            })
+        replies = builder.flush()
+        self.assertEqual(4, len(replies))
+        self.assertEqual(1, builder.round_trips)
+        self.assertEqual(sheet_id, replies[0].get('addSheet')
+                         .get('properties').get('sheetId'))
+        result = self.service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range='Report!A1:A3').execute()
+        self.assertEqual([['row 0'], ['row 1'], ['row 2']],
+                         result.get('values'))
+
+
+if __name__ == "__main__":
+    unittest.main()
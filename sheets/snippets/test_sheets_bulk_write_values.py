@@ -0,0 +1,46 @@
+"""
+Copyright 2022 Google LLC
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import array
+import unittest
+
+import sheets_bulk_write_values
+from base_test import BaseTest
+
+
+class Testbulkwritevalues(BaseTest):
+    """Unit test for bulk write values Sheet snippet"""
+
+    def test_bulk_write_values(self):
+        """writes columns in chunks"""
+        spreadsheet_id = self.create_test_spreadsheet()
+        result = sheets_bulk_write_values.bulk_write_values(
+            spreadsheet_id, 'Sheet1', [
+                array.array('d', [1.5, 2.5, 3.5, 4.5, 5.5]),
+                ['A', 'B', 'C', 'D', 'E'],
+            ], start_cell='B2', chunk_cells=4)
+        self.assertIsNotNone(result)
+        self.assertEqual(10, result.get('totalUpdatedCells'))
+        self.assertEqual(5, result.get('totalUpdatedRows'))
+        values = self.service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range='Sheet1!B2:C6').execute()
+        self.assertEqual(['5.5', 'E'], values.get('values')[-1])
+
+    def test_column_letters(self):
+        """converts column indexes to letters and back"""
+        self.assertEqual('AB', sheets_bulk_write_values.column_letters(28))
+        self.assertEqual(28, sheets_bulk_write_values.column_index('AB'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Copyright 2022 Google LLC
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import tempfile
+import unittest
+
+import sheets_snapshot_cache
+from base_test import BaseTest
+
+
+class Testsnapshotcache(BaseTest):
+    """Unit test for snapshot cache Sheet snippet"""
+
+    def test_snapshot_cache(self):
+        """reuses responses until the spreadsheet changes"""
+        spreadsheet_id = self.create_test_spreadsheet()
+        self.populate_values(spreadsheet_id)
+        cache = sheets_snapshot_cache.SnapshotCache(
+            cache_dir=tempfile.mkdtemp(), drive_service=self.drive_service)
+        for _ in range(2):
+            result = sheets_snapshot_cache.get_values(
+                spreadsheet_id, 'A1:C2', cache=cache)
+            self.assertEqual('Hello', result.get('values')[0][0])
+        self.assertEqual(1, cache.hits)
+        self.service.spreadsheets().values().update(
+            spreadsheetId=spreadsheet_id, range='A1',
+            valueInputOption='RAW', body={'values': [['Changed']]}).execute()
+        result = sheets_snapshot_cache.get_values(
+            spreadsheet_id, 'A1:C2', cache=cache)
+        self.assertEqual('Changed', result.get('values')[0][0])
+        self.assertEqual(2, cache.misses)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Copyright 2022 Google LLC
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+import numpy
+import sheets_stream_values
+from base_test import BaseTest
+
+
+class Teststreamvalues(BaseTest):
+    """Unit test for stream values Sheet snippet"""
+
+    def test_stream_values(self):
+        """reads typed record batches per window"""
+        spreadsheet_id = self.create_test_spreadsheet()
+        self.service.spreadsheets().values().update(
+            spreadsheetId=spreadsheet_id, range='Sheet1!A1:B5',
+            valueInputOption='RAW',
+            body={'values': [[row, f'row {row}'] for row in range(5)]}
+        ).execute()
+        batches = list(sheets_stream_values.stream_values(
+            spreadsheet_id, 'Sheet1', first_column='A', last_column='B',
+            names=['number', 'label'], window_rows=2))
+        self.assertEqual([2, 2, 1], [len(batch) for batch in batches])
+        records = numpy.concatenate(batches)
+        self.assertEqual(numpy.float64, records['number'].dtype)
+        self.assertEqual([0, 1, 2, 3, 4], list(records['number']))
+        self.assertEqual('row 4', records['label'][-1])
+
+    def test_stream_values_blank_rows(self):
+        """keeps records aligned with sheet rows across blank windows"""
+        spreadsheet_id = self.create_test_spreadsheet()
+        self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id, body={
+                'valueInputOption': 'RAW',
+                'data': [{'range': 'Sheet1!A1:B1', 'values': [[1, 'one']]},
+                         {'range': 'Sheet1!A8:B8',
+                          'values': [[8, 'eight']]}]}).execute()
+        batches = list(sheets_stream_values.stream_values(
+            spreadsheet_id, 'Sheet1', first_column='A', last_column='B',
+            end_row=20, names=['number', 'label'], window_rows=3))
+        self.assertEqual([3, 3, 2], [len(batch) for batch in batches])
+        records = numpy.concatenate(batches)
+        self.assertEqual(8, records['number'][7])
+        self.assertTrue(numpy.isnan(records['number'][6]))
+        self.assertEqual(object, records['label'].dtype)
+
+
+if __name__ == "__main__":
+    unittest.main()